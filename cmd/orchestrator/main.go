@@ -5,8 +5,10 @@ import (
     "log"
     "net"
     "net/http"
+    "time"
 
     "google.golang.org/grpc"
+    "google.golang.org/grpc/keepalive"
 
     orch "yuzu/agent/internal/orchestrator"
     gw "yuzu/agent/internal/orchestrator/pb"
@@ -19,7 +21,13 @@ var (
 
 func main(){
     flag.Parse()
-    s := grpc.NewServer()
+    // Accept the gateway's 20s keepalive pings (also between streams) instead of the default
+    // 5-minute policy, which answers them with GOAWAY too_many_pings
+    kasp := keepalive.EnforcementPolicy{
+        MinTime:             10 * time.Second,
+        PermitWithoutStream: true,
+    }
+    s := grpc.NewServer(grpc.KeepaliveEnforcementPolicy(kasp))
     srv := orch.NewServer()
     gw.RegisterGatewayControlServer(s, srv)
 
@@ -1,23 +1,73 @@
+import math
+import threading
 import time
 from collections import deque
 from dataclasses import dataclass
 from typing import Optional
 
 import numpy as np
-from scipy.signal import resample_poly
+from scipy.signal import firwin, resample_poly
 
 
 def now_mono_ms() -> int:
     return int(time.monotonic() * 1000)
 
 
-def downsample_48k_to_16k(pcm48: bytes) -> bytes:
-    if not pcm48:
+# Per-thread int32 scratch for squared samples: RMS runs on the loop, the SDK audio
+# thread and the stats threads, so one shared module buffer would race
+_rms_tls = threading.local()
+
+
+def _square_scratch(n: int) -> np.ndarray:
+    buf = getattr(_rms_tls, "sq", None)
+    if buf is None or buf.size < n:
+        buf = _rms_tls.sq = np.empty(max(n, 4096), dtype=np.int32)
+    return buf[:n]
+
+
+def mean_square_int16(pcm) -> float:
+    """Mean of squared PCM16 samples (bytes-like or int16 ndarray) using an integer sum of squares.
+
+    Each int16 square fits int32, so squares go into a reused int32 scratch; the sum
+    accumulates in int64 since a 20 ms frame of full-scale int16 overflows int32.
+    (np.dot/np.vdot on int16 would accumulate in int16 and wrap.)
+    Compare against threshold**2 to gate on energy without a sqrt.
+    """
+    x = pcm if isinstance(pcm, np.ndarray) else np.frombuffer(pcm, dtype=np.int16)
+    if x.size == 0:
+        return 0.0
+    sq = np.multiply(x, x, out=_square_scratch(x.size), dtype=np.int32)
+    return int(sq.sum(dtype=np.int64)) / x.size
+
+
+def rms_int16(pcm) -> float:
+    """RMS of PCM16 samples (bytes-like or int16 ndarray)."""
+    return math.sqrt(mean_square_int16(pcm))
+
+
+def downmix_stereo_int16(pcm: np.ndarray) -> np.ndarray:
+    """Average interleaved L/R int16 samples to mono in int32 (floor on odd sums), no float pass."""
+    left = pcm[0::2].astype(np.int32)
+    left += pcm[1::2]
+    left >>= 1
+    return left.astype(np.int16)
+
+
+# 3:1 anti-aliasing FIR for 48k -> 16k, designed once with the parameters resample_poly
+# would otherwise recompute on every call (61 taps, Kaiser beta 5, cutoff at 1/3 Nyquist)
+_DOWN3_TAPS = firwin(61, 1.0 / 3, window=('kaiser', 5.0)).astype(np.float32)
+_DOWN3_TAPS.setflags(write=False)
+
+
+def downsample_48k_to_16k(pcm48) -> bytes:
+    """48 kHz -> 16 kHz PCM16; accepts bytes-like or an int16 ndarray view of the frame."""
+    if len(pcm48) == 0:
         return b""
-    x = np.frombuffer(pcm48, dtype=np.int16).astype(np.float64)
-    y = resample_poly(x, up=1, down=3)
-    y_i16 = np.clip(y, -32768, 32767).astype(np.int16)
-    return y_i16.tobytes()
+    x = pcm48 if isinstance(pcm48, np.ndarray) else np.frombuffer(pcm48, dtype=np.int16)
+    # Polyphase decimation (upfirdn) in float32 with the precomputed taps
+    y = resample_poly(x.astype(np.float32), up=1, down=3, window=_DOWN3_TAPS)
+    np.clip(y, -32768, 32767, out=y)
+    return y.astype(np.int16).tobytes()
 
 
 @dataclass
@@ -49,29 +99,87 @@ class RingBuffer:
         return out
 
 
+class FrameSlicer:
+    """Cuts a byte stream into fixed-size frames.
+
+    Frames are copied out through a memoryview and a read offset advances, so popping a
+    frame never memmoves the unread tail; consumed bytes are compacted lazily.
+    """
+
+    def __init__(self, frame_bytes: int):
+        self.frame_bytes = int(frame_bytes)
+        self._buf = bytearray()
+        self._read = 0
+
+    def __len__(self) -> int:
+        return len(self._buf) - self._read
+
+    def push(self, data: bytes):
+        if data:
+            self._buf.extend(data)
+
+    def pop_frame(self) -> Optional[bytes]:
+        start = self._read
+        end = start + self.frame_bytes
+        if len(self._buf) < end:
+            return None
+        with memoryview(self._buf) as mv:
+            frame = bytes(mv[start:end])
+        if end == len(self._buf):
+            # Fully drained (the common case for frame-sized pushes): reset without a memmove
+            self._buf.clear()
+            self._read = 0
+        elif end > len(self._buf) // 2:
+            del self._buf[:end]
+            self._read = 0
+        else:
+            self._read = end
+        return frame
+
+    def frames(self):
+        """Yield every complete frame currently buffered."""
+        frame = self.pop_frame()
+        while frame is not None:
+            yield frame
+            frame = self.pop_frame()
+
+
 class FrameBatcher:
     def __init__(self, batch_ms: int = 100):
         self.batch_ms = int(batch_ms)
         self._bytes_per_ms = 32  # 16kHz mono * 2 bytes
         self._target = self.batch_ms * self._bytes_per_ms
         self._buf = bytearray()
+        # Read offset into _buf; consumed bytes are compacted lazily
+        self._read = 0
 
     def add(self, pcm16k: bytes):
         if pcm16k:
             self._buf.extend(pcm16k)
 
     def emit_ready(self) -> Optional[bytes]:
-        if len(self._buf) >= self._target:
-            chunk = bytes(self._buf[: self._target])
-            del self._buf[: self._target]
-            return chunk
-        return None
+        start = self._read
+        end = start + self._target
+        if len(self._buf) < end:
+            return None
+        with memoryview(self._buf) as mv:
+            chunk = bytes(mv[start:end])
+        self._read = end
+        # Compact once more than half the buffer has been consumed
+        if self._read > len(self._buf) // 2:
+            del self._buf[: self._read]
+            self._read = 0
+        return chunk
 
     def flush(self) -> Optional[bytes]:
-        if not self._buf:
+        if len(self._buf) <= self._read:
+            self._buf.clear()
+            self._read = 0
             return None
-        chunk = bytes(self._buf)
+        with memoryview(self._buf) as mv:
+            chunk = bytes(mv[self._read:])
         self._buf.clear()
+        self._read = 0
         return chunk
 
     def set_batch_ms(self, batch_ms: int):
@@ -79,3 +187,37 @@ class FrameBatcher:
         self.batch_ms = batch_ms
         self._target = self.batch_ms * self._bytes_per_ms
 
+
+
+class SampleWindow:
+    """Last `capacity` float samples in a preallocated float64 array (no per-sample objects).
+
+    Slots are overwritten round-robin, so values() is unordered; it is meant for
+    order-free statistics such as quantiles.
+    """
+    __slots__ = ('_buf', '_next', '_n')
+
+    def __init__(self, capacity: int):
+        self._buf = np.zeros(max(1, int(capacity)), dtype=np.float64)
+        self._next = 0
+        self._n = 0
+
+    def append(self, value: float):
+        buf = self._buf
+        buf[self._next] = value
+        self._next = (self._next + 1) % buf.size
+        if self._n < buf.size:
+            self._n += 1
+
+    def clear(self):
+        self._next = 0
+        self._n = 0
+
+    def __len__(self) -> int:
+        return self._n
+
+    def values(self) -> np.ndarray:
+        """Read-only view of the filled slots (unordered)."""
+        v = self._buf[: self._n]
+        v.flags.writeable = False
+        return v
@@ -1,14 +1,33 @@
 import asyncio
 import os
+from collections import deque
 from typing import Optional, Callable
 
 try:
     from . import gateway_control_pb2 as gw
-    from . import gateway_control_pb2_grpc as gw_grpc
 except Exception:
     # Fallback to absolute import if package-relative fails
     import gateway_control_pb2 as gw
-    import gateway_control_pb2_grpc as gw_grpc
+
+
+_SESSION_METHOD = '/gateway.v1.GatewayControl/Session'
+
+# Long-lived control stream: keep the HTTP/2 connection warm and let BDP probing
+# grow the flow-control window instead of stalling on the 64 KB default.
+_CHANNEL_OPTIONS = [
+    ('grpc.keepalive_time_ms', 20000),
+    ('grpc.keepalive_timeout_ms', 5000),
+    ('grpc.keepalive_permit_without_calls', 1),
+    ('grpc.http2.max_pings_without_data', 0),
+    ('grpc.http2.min_time_between_pings_ms', 10000),
+    ('grpc.http2.bdp_probe', 1),
+    ('grpc.max_send_message_length', 4 * 1024 * 1024),
+]
+
+
+def _passthrough(buf: bytes) -> bytes:
+    """Request serializer for events that were serialized at enqueue time."""
+    return buf
 
 
 def _grpc_error_info(e: Exception) -> str:
@@ -39,13 +58,17 @@ class GatewayControlClient:
         self._stop_event = stop_event
         self._state = state if state is not None else {}
         self._channel = None
-        self._stub = None
         self._call = None
         self._recv_task = None
         self._write_task = None
         self._feature_task = None
         self._reconnect_task = None
-        self._write_queue: asyncio.Queue = None  # Will be created in connect()
+        # Single-producer/single-consumer write queue: a plain deque plus wakeup events
+        # (created in connect()); bounded so a slow orchestrator cannot grow memory without limit
+        self._write_q: Optional[deque] = None
+        self._write_evt = asyncio.Event()   # set when an item is appended
+        self._space_evt = asyncio.Event()   # set when the writer frees a slot
+        self._write_queue_max: int = int(os.environ.get('ORCH_WRITE_QUEUE_MAX', '256'))
         self._closed = False
         self._reconnecting = False
         self._room_url_last: Optional[str] = None
@@ -55,14 +78,30 @@ class GatewayControlClient:
         self._feature_interval_sec: float = float(os.environ.get('ORCH_FEATURE_INTERVAL_SEC', '0.1'))
         # Optional callbacks that gateway wires
         self.on_start_tts: Optional[Callable[[str], asyncio.Future]] = None
+        # Reusable event templates: mutated in place and serialized immediately on enqueue
+        self._tmpl_feature = gw.GatewayEvent(session_id=self.session_id)
+        self._tmpl_feature.feature.SetInParent()
+        self._tmpl_interim = gw.GatewayEvent(session_id=self.session_id)
+        self._tmpl_interim.transcript_interim.SetInParent()
+        self._tmpl_final = gw.GatewayEvent(session_id=self.session_id)
+        self._tmpl_final.transcript_final.SetInParent()
+        self._tmpl_tts = gw.GatewayEvent(session_id=self.session_id)
+        self._tmpl_tts.tts.SetInParent()
+
+    def _open_session(self):
+        """Open the Session stream; requests are pre-serialized GatewayEvent bytes."""
+        return self._channel.stream_stream(
+            _SESSION_METHOD,
+            request_serializer=_passthrough,
+            response_deserializer=gw.OrchestratorCommand.FromString,
+        )()
 
     async def connect(self):
         from grpc import aio
         target = os.environ.get('ORCH_ADDR', 'localhost:9090')
-        self._channel = aio.insecure_channel(target)
-        self._stub = gw_grpc.GatewayControlStub(self._channel)
-        self._call = self._stub.Session()
-        self._write_queue = asyncio.Queue()
+        self._channel = aio.insecure_channel(target, options=_CHANNEL_OPTIONS)
+        self._call = self._open_session()
+        self._write_q = deque()
         self._recv_task = self._loop.create_task(self._recv_loop())
         self._write_task = self._loop.create_task(self._write_loop())
         self._feature_task = self._loop.create_task(self._feature_loop())
@@ -73,25 +112,25 @@ class GatewayControlClient:
     async def _write_loop(self):
         """Serialize all writes through a single coroutine to avoid races."""
         try:
+            q = self._write_q
             while not self._closed:
-                try:
-                    # Wait for next message with timeout to check closed flag
-                    msg = await asyncio.wait_for(self._write_queue.get(), timeout=1.0)
-                except asyncio.TimeoutError:
+                if not q:
+                    self._write_evt.clear()
+                    try:
+                        # Wait for next message with timeout to check closed flag
+                        await asyncio.wait_for(self._write_evt.wait(), timeout=1.0)
+                    except asyncio.TimeoutError:
+                        pass
                     continue
-                if msg is None:  # Shutdown signal
-                    break
+                item = q.popleft()
+                self._space_evt.set()
                 if self._call is None:
                     # Drop non-critical telemetry silently; log once for critical types
                     continue
+                # Items are (evt oneof name, serialized GatewayEvent, detail for logs)
+                which, buf, detail = item
                 try:
-                    # Identify message type for logging
-                    which = None
-                    try:
-                        which = msg.WhichOneof('evt')
-                    except Exception:
-                        which = None
-                    await self._call.write(msg)
+                    await self._call.write(buf)
                 except Exception as e:
                     # Log first write error
                     if not getattr(self, '_write_error_logged', False):
@@ -105,7 +144,7 @@ class GatewayControlClient:
                                   metrics={"error": err_tag, "successful_sends_before_fail": int(self._state.get('features_sent_ok', 0))})
                     elif which == 'tts':
                         self._log("orchestrator_tts_event_failed", session_id=self.session_id,
-                                  metrics={"type": getattr(getattr(msg, 'tts', None), 'type', ''), "error": err_tag})
+                                  metrics={"type": detail, "error": err_tag})
                     elif which == 'transcript_final':
                         self._log("orchestrator_transcript_send_error", session_id=self.session_id,
                                   metrics={"error": err_tag})
@@ -119,12 +158,9 @@ class GatewayControlClient:
 
     async def close(self):
         self._closed = True
-        # Signal write loop to stop
-        if self._write_queue is not None:
-            try:
-                self._write_queue.put_nowait(None)
-            except Exception:
-                pass
+        # Wake the write loop (and any blocked critical enqueue) so they observe _closed
+        self._write_evt.set()
+        self._space_evt.set()
         # Cancel tasks
         if self._write_task is not None:
             self._write_task.cancel()
@@ -155,25 +191,61 @@ class GatewayControlClient:
         except Exception:
             pass
 
-    def _enqueue(self, msg):
-        """Thread-safe: enqueue a message for the write loop."""
-        if self._write_queue is None or self._closed:
+    def _enqueue(self, which: str, buf: bytes, detail: str = ""):
+        """Enqueue a serialized event for the write loop (must run on the client's loop).
+
+        When the queue is full, the oldest pending feature (telemetry) is dropped
+        to make room. Returns False if nothing could be dropped; critical events
+        should go through _enqueue_critical instead.
+        """
+        q = self._write_q
+        if q is None or self._closed:
             return False
-        try:
-            self._write_queue.put_nowait(msg)
-            return True
-        except Exception:
+        if len(q) >= self._write_queue_max and not self._drop_oldest_feature():
             return False
+        q.append((which, buf, detail))
+        self._write_evt.set()
+        return True
+
+    async def _enqueue_critical(self, which: str, buf: bytes, detail: str = ""):
+        """Enqueue an event that must not be dropped, applying backpressure when full."""
+        while not self._enqueue(which, buf, detail):
+            if self._write_q is None or self._closed:
+                return False
+            self._space_evt.clear()
+            try:
+                await asyncio.wait_for(self._space_evt.wait(), timeout=1.0)
+            except asyncio.TimeoutError:
+                pass
+        return True
+
+    def _drop_oldest_feature(self) -> bool:
+        """Remove the oldest queued feature event. Returns True if one was dropped."""
+        pending = self._write_q
+        for i, queued in enumerate(pending):
+            if queued[0] == 'feature':
+                del pending[i]
+                self._state['features_dropped'] = int(self._state.get('features_dropped', 0)) + 1
+                return True
+        return False
 
     async def send_session_open(self, room_url: str):
         if self._closed:
             return
         self._room_url_last = room_url
         ev = gw.GatewayEvent(session_id=self.session_id, session_open=gw.SessionOpen(session_id=self.session_id, room_url=room_url))
-        self._enqueue(ev)
+        await self._enqueue_critical('session_open', ev.SerializeToString())
 
     async def send_feature(self, rms: float):
         """Coalesce features to a 10Hz loop. Store latest RMS; writer will send."""
+        self.record_feature(rms)
+
+    def record_feature(self, rms: float):
+        """Thread-safe, non-blocking: store the latest RMS for _feature_loop to send.
+
+        Safe to call from the audio thread; the single attribute store is atomic
+        under the GIL, so no coroutine needs to be scheduled per frame.
+        """
         if self._closed:
             return
         try:
@@ -184,27 +256,29 @@ class GatewayControlClient:
     async def send_transcript_interim(self, utterance_id: str, text: str):
         if self._closed or self._call is None:
             return
-        ev = gw.GatewayEvent(session_id=self.session_id, transcript_interim=gw.TranscriptInterim(utterance_id=utterance_id, text=text))
-        self._enqueue(ev)
+        ev = self._tmpl_interim
+        ev.transcript_interim.utterance_id = utterance_id
+        ev.transcript_interim.text = text
+        self._enqueue('transcript_interim', ev.SerializeToString())
 
     async def send_transcript_final(self, utterance_id: str, text: str):
         if self._closed or self._call is None:
             return
-        ev = gw.GatewayEvent(session_id=self.session_id, transcript_final=gw.TranscriptFinal(utterance_id=utterance_id, text=text))
-        if self._enqueue(ev):
+        ev = self._tmpl_final
+        ev.transcript_final.utterance_id = utterance_id
+        ev.transcript_final.text = text
+        if await self._enqueue_critical('transcript_final', ev.SerializeToString()):
             self._log("orchestrator_transcript_queued", session_id=self.session_id, metrics={"text_len": len(text)})
 
     async def send_tts_event(self, typ: str, reason: str = "", first_audio_ms: int | None = None):
         if self._closed:
             self._log("orchestrator_tts_event_call_none", session_id=self.session_id, metrics={"type": typ})
             return
-        evt = gw.TTSEvent(type=typ)
-        if reason:
-            evt.reason = reason
-        if first_audio_ms is not None:
-            evt.first_audio_ms = int(first_audio_ms)
-        ev = gw.GatewayEvent(session_id=self.session_id, tts=evt)
-        if self._enqueue(ev):
+        ev = self._tmpl_tts
+        ev.tts.type = typ
+        ev.tts.reason = reason or ""
+        ev.tts.first_audio_ms = int(first_audio_ms) if first_audio_ms is not None else 0
+        if await self._enqueue_critical('tts', ev.SerializeToString(), typ):
             self._log("orchestrator_tts_event_queued", session_id=self.session_id, metrics={"type": typ})
 
     async def _recv_loop(self):
@@ -273,8 +347,8 @@ class GatewayControlClient:
                     continue
                 # Only send if changed significantly or enough time passed
                 if self._feature_last_sent is None or abs(v - self._feature_last_sent) >= 1.0:
-                    ev = gw.GatewayEvent(session_id=self.session_id, feature=gw.Feature(rms=float(v)))
-                    if self._enqueue(ev):
+                    self._tmpl_feature.feature.rms = float(v)
+                    if self._enqueue('feature', self._tmpl_feature.SerializeToString()):
                         # Track successful enqueue to help diagnose send failures
                         self._state['features_sent_ok'] = int(self._state.get('features_sent_ok', 0)) + 1
                     self._feature_last_sent = v
@@ -299,9 +373,8 @@ class GatewayControlClient:
                     target = os.environ.get('ORCH_ADDR', 'localhost:9090')
                     # Reuse channel if possible
                     if self._channel is None:
-                        self._channel = aio.insecure_channel(target)
-                    self._stub = gw_grpc.GatewayControlStub(self._channel)
-                    call = self._stub.Session()
+                        self._channel = aio.insecure_channel(target, options=_CHANNEL_OPTIONS)
+                    call = self._open_session()
                     # Swap in
                     self._call = call
                     # Start a fresh recv loop
@@ -309,7 +382,8 @@ class GatewayControlClient:
                     # Re-send session_open if we have it
                     if self._room_url_last:
                         ev = gw.GatewayEvent(session_id=self.session_id, session_open=gw.SessionOpen(session_id=self.session_id, room_url=self._room_url_last))
-                        self._enqueue(ev)
+                        # Handshake must not be dropped behind queued interims/features
+                        await self._enqueue_critical('session_open', ev.SerializeToString())
                     self._log("orchestrator_reconnected", session_id=self.session_id)
                     backoff = 0.2
                 except Exception as e:
@@ -4,24 +4,68 @@ import sys
 import time
 import json
 import asyncio
+import functools
+import io
+import struct
+import wave
 import urllib.parse
+from collections import deque
+from math import gcd
 from .gateway_control_client import GatewayControlClient
 from .stt_sidecar_client import STTSidecarClient
-from .audio_utils import RingBuffer, FrameBatcher, downsample_48k_to_16k
+from .audio_utils import RingBuffer, FrameBatcher, FrameSlicer, SampleWindow, downsample_48k_to_16k, downmix_stereo_int16, rms_int16, mean_square_int16
 from .tts_client import TTSClient
 import webrtcvad
 import numpy as np
-import contextlib
+from scipy.signal import firwin, resample_poly
+import queue
 import threading
+import atexit
 import daily
 
+try:
+    import orjson
+except ImportError:  # optional; falls back to the stdlib encoder
+    orjson = None
+
+try:
+    import soxr
+except ImportError:  # optional; whole-utterance resampling falls back to resample_poly
+    soxr = None
+
+try:
+    import uvloop
+except ImportError:  # optional; the entrypoint falls back to the default asyncio loop
+    uvloop = None
+
+
+if orjson is not None:
+    _ORJSON_OPTS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+    def _json_dumps(obj) -> str:
+        try:
+            return orjson.dumps(obj, option=_ORJSON_OPTS).decode()
+        except TypeError:
+            # Types orjson rejects (e.g. float subclasses) still go through json
+            return json.dumps(obj)
+
+    _json_loads = orjson.loads
+else:
+    _json_dumps = json.dumps
+    _json_loads = json.loads
+
 
 def _now_ts_ms():
-    return int(time.time() * 1000)
+    return time.time_ns() // 1_000_000
 
 
 def _mono_ms():
-    return int(time.monotonic() * 1000)
+    return time.monotonic_ns() // 1_000_000
+
+
+# Playback pacing in integer nanoseconds so the frame schedule does not drift over long TTS
+_FRAME_NS = 20_000_000
+_MIN_SLEEP_NS = 5_000_000  # only sleep when at least 5ms remain before the next frame
 
 
 # Log configuration
@@ -64,6 +108,17 @@ LOG_MIN_EVENTS = set((os.environ.get("LOG_MIN_EVENTS", "") or "").split(",")) if
     "remote_audio_first_frame", "candidate_audio_hook_set",
     "speaker_reader_started", "speaker_reader_stats",
 }
+_LOG_ENABLED: frozenset[str] = frozenset(LOG_MIN_EVENTS)
+
+
+def _should_log(event: str) -> bool:
+    return LOG_VERBOSE or event in _LOG_ENABLED
+
+
+# Resolved once at import so per-frame call sites skip building metrics for suppressed events
+_LOG_VAD_FRAME_INFO = _should_log("vad_frame_info")
+_LOG_VAD_SPEAKING_STATS = _should_log("vad_speaking_stats")
+_LOG_AUDIO_PROCESSED_RMS = _should_log("audio_processed_rms")
 
 
 def _log_icon(event: str) -> str:
@@ -81,6 +136,124 @@ def _log_icon(event: str) -> str:
     return "▶"
 
 
+def _sum_tts_timing(m: dict) -> list[str]:
+    if m.get("first_frame_sent_ts_ms") and m.get("tts_started_ts_ms"):
+        return [f"first_audio={m['first_frame_sent_ts_ms'] - m['tts_started_ts_ms']}ms"]
+    return []
+
+
+def _sum_tts_first_audio(m: dict) -> list[str]:
+    return [f"latency={m['first_audio_ms']}ms"] if m.get("first_audio_ms") else []
+
+
+def _sum_tts_started(m: dict) -> list[str]:
+    parts = []
+    if m.get("text_chars"):
+        parts.append(f"chars={m['text_chars']}")
+    if m.get("streaming") is not None:
+        parts.append(f"streaming={m['streaming']}")
+    return parts
+
+
+def _sum_tts_playback_done(m: dict) -> list[str]:
+    parts = []
+    if m.get("sent_frames"):
+        parts.append(f"frames={m['sent_frames']}")
+    if m.get("completed_normally") is not None:
+        parts.append("completed" if m["completed_normally"] else "interrupted")
+    return parts
+
+
+def _sum_local_stop(m: dict) -> list[str]:
+    parts = []
+    if m.get("rms") is not None:
+        parts.append(f"rms={int(m['rms'])}")
+    if m.get("guard_ok") is not None:
+        parts.append(f"guard={'ok' if m['guard_ok'] else 'wait'}")
+    if m.get("speaking_armed") is not None:
+        parts.append(f"armed={m['speaking_armed']}")
+    return parts
+
+
+def _sum_barge_in(m: dict) -> list[str]:
+    return [f"latency={m['latency_ms']}ms"] if m.get("latency_ms") is not None else []
+
+
+def _sum_participant(m: dict) -> list[str]:
+    return [f"id={m['participant_id'][:8]}"] if m.get("participant_id") else []
+
+
+def _sum_waiting_for_participant(m: dict) -> list[str]:
+    return [f"timeout={m['timeout_s']}s"] if m.get("timeout_s") else []
+
+
+def _sum_tts_mode(m: dict) -> list[str]:
+    return [f"streaming={m['streaming']}"] if m.get("streaming") is not None else []
+
+
+def _sum_mic_enabled(m: dict) -> list[str]:
+    return [f"processing={m['audio_processing']}"] if m.get("audio_processing") else []
+
+
+def _sum_remote_audio_first_frame(m: dict) -> list[str]:
+    parts = []
+    if m.get("len"):
+        parts.append(f"len={m['len']}")
+    if m.get("rms_as_int16") is not None:
+        parts.append(f"rms_i16={m['rms_as_int16']}")
+    if m.get("rms_as_float32") is not None:
+        parts.append(f"rms_f32={m['rms_as_float32']}")
+    if m.get("likely_format"):
+        parts.append(f"format={m['likely_format']}")
+    return parts
+
+
+def _sum_error(m: dict) -> list[str]:
+    parts = []
+    if m.get("message"):
+        msg = m["message"][:60] + "..." if len(m.get("message", "")) > 60 else m.get("message", "")
+        parts.append(msg)
+    if m.get("error"):
+        parts.append(f"error={m['error'][:40]}")
+    return parts
+
+
+def _sum_generic(m: dict) -> list[str]:
+    """Show the first 2-3 simple values."""
+    parts = []
+    for k, v in m.items():
+        if len(parts) >= 3:
+            break
+        if isinstance(v, (str, int, float, bool)) and v is not None:
+            if isinstance(v, float):
+                parts.append(f"{k}={v:.1f}")
+            elif isinstance(v, str) and len(v) > 20:
+                parts.append(f"{k}={v[:20]}...")
+            else:
+                parts.append(f"{k}={v}")
+    return parts
+
+
+# Event-specific summaries (most important fields only); anything else uses _sum_generic
+_SUMMARY_HANDLERS = {
+    "tts_timing_breakdown": _sum_tts_timing,
+    "tts_first_audio": _sum_tts_first_audio,
+    "tts_started": _sum_tts_started,
+    "tts_playback_done": _sum_tts_playback_done,
+    "local_stop_triggered": _sum_local_stop,
+    "vad_start_suppressed": _sum_local_stop,
+    "barge_in_detected": _sum_barge_in,
+    "participant_joined": _sum_participant,
+    "subscribed_media": _sum_participant,
+    "bot_waiting_for_participant": _sum_waiting_for_participant,
+    "tts_mode": _sum_tts_mode,
+    "daily_mic_enabled": _sum_mic_enabled,
+    "remote_audio_first_frame": _sum_remote_audio_first_frame,
+    "stderr": _sum_error,
+    "bot_error": _sum_error,
+}
+
+
 def _log_summary(event: str, reason: str | None, metrics: dict | None) -> str:
     """Return concise summary of key metrics for pretty format."""
     parts = []
@@ -88,90 +261,98 @@ def _log_summary(event: str, reason: str | None, metrics: dict | None) -> str:
         parts.append(f"reason={reason}")
     if not metrics:
         return " ".join(parts)
+    parts.extend(_SUMMARY_HANDLERS.get(event, _sum_generic)(metrics))
+    return " ".join(parts)
 
-    # Event-specific summaries (most important fields only)
-    m = metrics
-    if event == "tts_timing_breakdown":
-        if m.get("first_frame_sent_ts_ms") and m.get("tts_started_ts_ms"):
-            latency = m["first_frame_sent_ts_ms"] - m["tts_started_ts_ms"]
-            parts.append(f"first_audio={latency}ms")
-    elif event == "tts_first_audio":
-        if m.get("first_audio_ms"):
-            parts.append(f"latency={m['first_audio_ms']}ms")
-    elif event == "tts_started":
-        if m.get("text_chars"):
-            parts.append(f"chars={m['text_chars']}")
-        if m.get("streaming") is not None:
-            parts.append(f"streaming={m['streaming']}")
-    elif event == "tts_playback_done":
-        if m.get("sent_frames"):
-            parts.append(f"frames={m['sent_frames']}")
-        if m.get("completed_normally") is not None:
-            parts.append("completed" if m["completed_normally"] else "interrupted")
-    elif event in ("local_stop_triggered", "vad_start_suppressed"):
-        if m.get("rms") is not None:
-            parts.append(f"rms={int(m['rms'])}")
-        if m.get("guard_ok") is not None:
-            parts.append(f"guard={'ok' if m['guard_ok'] else 'wait'}")
-        if m.get("speaking_armed") is not None:
-            parts.append(f"armed={m['speaking_armed']}")
-    elif event == "barge_in_detected":
-        if m.get("latency_ms") is not None:
-            parts.append(f"latency={m['latency_ms']}ms")
-    elif event == "participant_joined" or event == "subscribed_media":
-        if m.get("participant_id"):
-            parts.append(f"id={m['participant_id'][:8]}")
-    elif event == "bot_waiting_for_participant":
-        if m.get("timeout_s"):
-            parts.append(f"timeout={m['timeout_s']}s")
-    elif event == "tts_mode":
-        if m.get("streaming") is not None:
-            parts.append(f"streaming={m['streaming']}")
-    elif event == "daily_mic_enabled":
-        if m.get("audio_processing"):
-            parts.append(f"processing={m['audio_processing']}")
-    elif event == "remote_audio_first_frame":
-        if m.get("len"):
-            parts.append(f"len={m['len']}")
-        if m.get("rms_as_int16") is not None:
-            parts.append(f"rms_i16={m['rms_as_int16']}")
-        if m.get("rms_as_float32") is not None:
-            parts.append(f"rms_f32={m['rms_as_float32']}")
-        if m.get("likely_format"):
-            parts.append(f"format={m['likely_format']}")
-    elif event == "stderr" or event == "bot_error":
-        if m.get("message"):
-            msg = m["message"][:60] + "..." if len(m.get("message", "")) > 60 else m.get("message", "")
-            parts.append(msg)
-        if m.get("error"):
-            parts.append(f"error={m['error'][:40]}")
-    else:
-        # Generic: show first 2-3 simple values
-        shown = 0
-        for k, v in m.items():
-            if shown >= 3:
+
+# Log lines are handed to a single background writer thread so audio callbacks never
+# block on stdout. The writer batches up to _LOG_BATCH_MAX lines or _LOG_BATCH_WINDOW_SEC.
+_LOG_BATCH_MAX = 64
+_LOG_BATCH_WINDOW_SEC = 0.01
+_log_queue: "queue.SimpleQueue[str | tuple | None]" = queue.SimpleQueue()
+
+# Hot events are queued as (code, ts_ms, mono_ms, session_id, values) tokens so the audio
+# thread only builds a tuple; the writer thread expands them into the metrics dict.
+_EV_VAD_SPEAKING_STATS = 1
+_EV_VAD_START_STT_CHECK = 2
+_EVENT_TOKENS = {
+    _EV_VAD_SPEAKING_STATS: ("vad_speaking_stats", (
+        "speech_frames", "nonspeech_frames", "speech_pct", "current_non_speech",
+        "hangover_needed", "frame_rms", "is_speech")),
+    _EV_VAD_START_STT_CHECK: ("debug_vad_start_stt_check", (
+        "stt_continuous", "stt_client_exists", "in_utterance", "rms", "stt_min_rms", "in_cooldown")),
+}
+
+
+def _expand_event_token(tok: tuple) -> str:
+    code, ts_ms, mono_ms, session_id, values = tok
+    event, fields = _EVENT_TOKENS[code]
+    return _format_log_record(ts_ms, mono_ms, event, session_id, None, "worker_local", None, dict(zip(fields, values)))
+
+
+def _log_writer_loop():
+    q = _log_queue
+    while True:
+        line = q.get()
+        if line is None:
+            return
+        batch = [line]
+        stop = False
+        deadline = time.monotonic() + _LOG_BATCH_WINDOW_SEC
+        while len(batch) < _LOG_BATCH_MAX:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
                 break
-            if isinstance(v, (str, int, float, bool)) and v is not None:
-                if isinstance(v, float):
-                    parts.append(f"{k}={v:.1f}")
-                elif isinstance(v, str) and len(v) > 20:
-                    parts.append(f"{k}={v[:20]}...")
-                else:
-                    parts.append(f"{k}={v}")
-                shown += 1
+            try:
+                nxt = q.get(timeout=remaining)
+            except queue.Empty:
+                break
+            if nxt is None:
+                stop = True
+                break
+            batch.append(nxt)
+        lines = []
+        for item in batch:
+            if type(item) is tuple:
+                try:
+                    item = _expand_event_token(item)
+                except Exception:
+                    continue
+            lines.append(item)
+        try:
+            if lines:
+                sys.stdout.write("\n".join(lines) + "\n")
+                sys.stdout.flush()
+        except Exception:
+            pass
+        if stop:
+            return
 
-    return " ".join(parts)
 
+_log_writer = threading.Thread(target=_log_writer_loop, name="log-writer", daemon=True)
+_log_writer.start()
+
+
+def _log_write(line: str):
+    _log_queue.put_nowait(line)
+
+
+def _log_shutdown():
+    """Drain pending log lines before the interpreter exits."""
+    _log_queue.put_nowait(None)
+    _log_writer.join(timeout=2.0)
 
-def log_event(event: str, session_id: str = None, utterance_id: str = None, src: str = "worker_local", reason: str = None, metrics: dict | None = None):
-    if not LOG_VERBOSE and event not in LOG_MIN_EVENTS:
-        return
 
+atexit.register(_log_shutdown)
+
+
+def _format_log_record(ts_ms: int, mono_ms: int, event: str, session_id: str | None, utterance_id: str | None,
+                       src: str, reason: str | None, metrics: dict | None) -> str:
     if LOG_FORMAT == "json":
         # Machine-readable JSON format
         rec = {
-            "ts_ms": _now_ts_ms(),
-            "mono_ms": _mono_ms(),
+            "ts_ms": ts_ms,
+            "mono_ms": mono_ms,
             "event": event,
             "src": src,
         }
@@ -183,16 +364,28 @@ def log_event(event: str, session_id: str = None, utterance_id: str = None, src:
             rec["reason"] = reason
         if metrics:
             rec["metrics"] = metrics
-        print(json.dumps(rec), flush=True)
-    else:
-        # Human-readable pretty format
-        ts = time.strftime("%H:%M:%S", time.localtime())
-        ms = int(time.time() * 1000) % 1000
-        icon = _log_icon(event)
-        summary = _log_summary(event, reason, metrics)
-        # Truncate session_id for display
-        sid_short = f" [{session_id[:8]}]" if session_id else ""
-        print(f"{ts}.{ms:03d} {icon} {event:<28}{sid_short} {summary}", flush=True)
+        return _json_dumps(rec)
+    # Human-readable pretty format
+    ts = time.strftime("%H:%M:%S", time.localtime(ts_ms / 1000))
+    ms = ts_ms % 1000
+    icon = _log_icon(event)
+    summary = _log_summary(event, reason, metrics)
+    # Truncate session_id for display
+    sid_short = f" [{session_id[:8]}]" if session_id else ""
+    return f"{ts}.{ms:03d} {icon} {event:<28}{sid_short} {summary}"
+
+
+def log_event(event: str, session_id: str = None, utterance_id: str = None, src: str = "worker_local", reason: str = None, metrics: dict | None = None):
+    if not LOG_VERBOSE and event not in _LOG_ENABLED:
+        return
+    _log_write(_format_log_record(_now_ts_ms(), _mono_ms(), event, session_id, utterance_id, src, reason, metrics))
+
+
+def _log_event_token(code: int, session_id: str | None, *values):
+    """Queue a hot event as a token; field names and formatting are applied on the writer thread."""
+    if not LOG_VERBOSE and _EVENT_TOKENS[code][0] not in _LOG_ENABLED:
+        return
+    _log_queue.put_nowait((code, _now_ts_ms(), _mono_ms(), session_id, values))
 
 
 def log(msg: str, **kwargs):
@@ -220,8 +413,28 @@ def required_env(name):
     return val
 
 
-def fetch_tts_wav(eleven_api_key, voice_id, text):
-    import requests
+_tts_client = None
+
+
+def _tts_http_client():
+    """Lazily created HTTP/2 client kept for the life of the event loop (keep-alive to ElevenLabs)."""
+    global _tts_client
+    if _tts_client is None:
+        import httpx
+        _tts_client = httpx.AsyncClient(http2=True, timeout=30.0, limits=httpx.Limits(max_keepalive_connections=4))
+    return _tts_client
+
+
+async def _close_tts_http_client():
+    """Close the pooled client (and its HTTP/2 connections) at shutdown; a later use opens a new one."""
+    global _tts_client
+    client, _tts_client = _tts_client, None
+    if client is not None:
+        await client.aclose()
+
+
+async def fetch_tts_wav_async(eleven_api_key, voice_id, text, metrics=None):
+    """Fetch a complete WAV from ElevenLabs; streams the body so first-chunk timing is observable."""
     url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}"
     headers = {
         "xi-api-key": eleven_api_key,
@@ -229,14 +442,23 @@ def fetch_tts_wav(eleven_api_key, voice_id, text):
         "content-type": "application/json",
     }
     data = {"text": text}
-    resp = requests.post(url, headers=headers, data=json.dumps(data), timeout=30)
-    resp.raise_for_status()
-    return resp.content
+    chunks = []
+    if metrics is not None:
+        metrics.mark_request_sent()
+    async with _tts_http_client().stream("POST", url, headers=headers, json=data) as resp:
+        if metrics is not None:
+            metrics.mark_headers()
+        resp.raise_for_status()
+        async for chunk in resp.aiter_bytes():
+            if not chunks and metrics is not None:
+                metrics.mark_first_chunk(len(chunk))
+            chunks.append(chunk)
+    if metrics is not None:
+        metrics.mark_stream_end()
+    return b"".join(chunks)
 
 
 def decode_wav_pcm16(wav_bytes):
-    import io
-    import wave
     bio = io.BytesIO(wav_bytes)
     with wave.open(bio, 'rb') as wf:
         n_channels = wf.getnchannels()
@@ -248,27 +470,62 @@ def decode_wav_pcm16(wav_bytes):
         raise RuntimeError(f"expected 16-bit PCM, got {sampwidth*8}-bit")
     pcm = np.frombuffer(raw, dtype=np.int16)
     if n_channels == 2:
-        pcm = pcm.reshape(-1, 2).mean(axis=1).astype(np.int16)
+        pcm = downmix_stereo_int16(pcm)
     return pcm, framerate, n_channels
 
 
+@functools.lru_cache(maxsize=8)
+def _resample_filter(sr: int, target: int = 48000):
+    """Polyphase ratio and float32 anti-aliasing FIR for sr -> target (same design as resample_poly)."""
+    g = gcd(target, sr)
+    up = target // g
+    down = sr // g
+    max_rate = max(up, down)
+    taps = firwin(2 * 10 * max_rate + 1, 1.0 / max_rate, window=('kaiser', 5.0)).astype(np.float32)
+    taps.setflags(write=False)
+    return up, down, taps
+
+
 def resample_to_48k(pcm_int16, sr):
     """Resample PCM16 audio to 48kHz using high-quality polyphase resampling."""
-    from scipy.signal import resample_poly
-    from math import gcd
     target = 48000
     if sr == target:
         return pcm_int16
-    # Use polyphase resampling for better quality
-    # resample_poly(x, up, down) where up/down = target/sr simplified
-    g = gcd(target, sr)
-    up = target // g
-    down = sr // g
-    # Convert to float, resample, convert back
-    x = pcm_int16.astype(np.float64)
-    y = resample_poly(x, up, down)
-    y_int16 = np.clip(y, -32768, 32767).astype(np.int16)
-    return y_int16
+    # Filter design is cached per input rate; filtering runs in float32
+    up, down, taps = _resample_filter(sr, target)
+    x = pcm_int16.astype(np.float32)
+    y = resample_poly(x, up, down, window=taps)
+    np.clip(y, -32768, 32767, out=y)
+    return y.astype(np.int16)
+
+
+_tts_decode_executor = None
+
+
+def _tts_decode_pool():
+    """Lazily created single-thread pool for WAV decode + resample.
+
+    Kept apart from the default executor, which also runs the blocking Daily join and the
+    participant wait (up to minutes), so decoding never queues behind them.
+    """
+    global _tts_decode_executor
+    if _tts_decode_executor is None:
+        from concurrent.futures import ThreadPoolExecutor
+        _tts_decode_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='tts-decode')
+    return _tts_decode_executor
+
+
+def decode_wav_to_pcm48k(wav_bytes) -> bytes:
+    """Decode a PCM16 WAV and resample it to 48kHz mono PCM16 bytes."""
+    pcm_arr, sr_in, _ = decode_wav_pcm16(wav_bytes)
+    if soxr is not None and sr_in != 48000:
+        # One C call, int16 in and out (no float32 round-trip in Python)
+        return soxr.resample(pcm_arr, sr_in, 48000).tobytes()
+    return resample_to_48k(pcm_arr, sr_in).tobytes()
+
+
+# Ambient RMS samples kept while TTS is speaking (one per second) for the dynamic barge-in threshold
+RMS_SAMPLES_MAX = 64
 
 
 class VADState:
@@ -288,12 +545,13 @@ class VADState:
         self._speech_while_speaking = 0
         self._nonspeech_while_speaking = 0
 
-    def process_frame(self, pcm16_bytes, sample_rate):
+    def process_frame(self, pcm16_bytes, sample_rate, now_ms=None, arr=None):
         self._frame_count += 1
-        # Calculate RMS for frame
+        # Calculate RMS for frame (reuse the caller's int16 view when provided)
         try:
-            arr = np.frombuffer(pcm16_bytes, dtype=np.int16)
-            frame_rms = float(np.sqrt(np.mean(arr.astype(np.float64)**2))) if arr.size > 0 else 0.0
+            if arr is None:
+                arr = np.frombuffer(pcm16_bytes, dtype=np.int16)
+            frame_rms = rms_int16(arr)
         except:
             frame_rms = 0.0
         info = {
@@ -302,9 +560,11 @@ class VADState:
             'min_start_frames': self.min_start_frames,
             'speaking': self.speaking,
             'prestart': False,
+            'rms': frame_rms,
+            'arr': arr,
         }
         # Log first few frames to verify frame size
-        if self._frame_count <= 3:
+        if _LOG_VAD_FRAME_INFO and self._frame_count <= 3:
             log_event("vad_frame_info", metrics={"frame": self._frame_count, "bytes": len(pcm16_bytes), "sample_rate": sample_rate, "expected_bytes": int(sample_rate * 0.02) * 2, "rms": int(frame_rms)})
         try:
             is_speech = self.vad.is_speech(pcm16_bytes, sample_rate)
@@ -313,7 +573,8 @@ class VADState:
             if self._frame_count <= 5:
                 log_event("vad_is_speech_error", metrics={"frame": self._frame_count, "error": str(e), "frame_bytes": len(pcm16_bytes), "sample_rate": sample_rate})
         info['is_speech'] = is_speech
-        now_ms = int(time.time() * 1000)
+        if now_ms is None:
+            now_ms = _now_ts_ms()
 
         # Track is_speech while in speaking state
         if self.speaking:
@@ -323,16 +584,15 @@ class VADState:
                 self._nonspeech_while_speaking += 1
             # Log every 50 frames while speaking to diagnose why 'end' never fires
             total_speaking_frames = self._speech_while_speaking + self._nonspeech_while_speaking
-            if total_speaking_frames % 50 == 0:
-                log_event("vad_speaking_stats", metrics={
-                    "speech_frames": self._speech_while_speaking,
-                    "nonspeech_frames": self._nonspeech_while_speaking,
-                    "speech_pct": int(100 * self._speech_while_speaking / max(1, total_speaking_frames)),
-                    "current_non_speech": self.non_speech,
-                    "hangover_needed": self.hangover_frames,
-                    "frame_rms": int(frame_rms),
-                    "is_speech": is_speech,
-                })
+            if _LOG_VAD_SPEAKING_STATS and total_speaking_frames % 50 == 0:
+                _log_event_token(_EV_VAD_SPEAKING_STATS, None,
+                                 self._speech_while_speaking,
+                                 self._nonspeech_while_speaking,
+                                 int(100 * self._speech_while_speaking / max(1, total_speaking_frames)),
+                                 self.non_speech,
+                                 self.hangover_frames,
+                                 int(frame_rms),
+                                 is_speech)
         if not self.speaking:
             if is_speech:
                 self.consec_speech += 1
@@ -389,6 +649,56 @@ class VADState:
                 return None, None, info
 
 
+class LoopCallQueue:
+    """Ordered hand-off of coroutine calls from the audio thread to the event loop.
+
+    The audio thread appends (fn, args) to a deque and wakes the loop only when no wake-up
+    is already pending; a single drain task awaits the calls in submission order.
+    Must be constructed on the loop thread.
+    """
+    def __init__(self, loop):
+        self.loop = loop
+        self._q = deque()
+        self._wake = asyncio.Event()
+        self._wake_pending = False
+        self._task = loop.create_task(self._drain())
+
+    def submit(self, fn, *args):
+        """Thread-safe: queue fn(*args) to be awaited on the loop."""
+        self._q.append((fn, args))
+        if not self._wake_pending:
+            self._wake_pending = True
+            self.loop.call_soon_threadsafe(self._wake.set)
+
+    async def close(self):
+        """Stop the drain task; calls still queued are dropped. Call on the loop thread."""
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+
+    async def _drain(self):
+        q = self._q
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            # Reset before draining so a submit racing with the drain re-arms the wake-up
+            self._wake_pending = False
+            while q:
+                fn, args = q.popleft()
+                try:
+                    await fn(*args)
+                except Exception as e:
+                    log_event("loop_call_error", metrics={"call": getattr(fn, '__name__', ''), "error": str(e)})
+
+
+async def _stt_send_chunks(stt_client, chunks):
+    """Send several batched STT chunks in order as one loop-queue call."""
+    for chunk in chunks:
+        await stt_client.send_audio(chunk)
+
+
 class VADManager:
     """Encapsulates VAD gating, counters, guard, energy checks, and WS signaling."""
     def __init__(self, loop, ws_queue, session_id, stop_event, state, vad: VADState):
@@ -400,42 +710,50 @@ class VADManager:
         self.vad = vad
         # STT streaming helpers (wired from attach_candidate_vad)
         self.stt_client = None
+        self.stt_calls = None  # LoopCallQueue carrying STT calls off the audio thread, in order
         self.ring_buffer = None
         self.frame_batcher = None
         self._in_utterance = False
         self._stt_continuous = os.environ.get('STT_CONTINUOUS', 'false').lower() not in ('0','false','no')
-        self._stt_suppression_until = 0  # Cooldown timestamp after suppression
-        # Ensure per-utterance counters exist in state (reset at utterance start elsewhere)
-        self.state.setdefault('vad_counters', {'vad_starts_total': 0, 'vad_stops_allowed': 0, 'vad_suppressed_guard': 0, 'vad_suppressed_energy': 0, 'vad_suppressed_minframes': 0})
-
-    def on_frame(self, frame: bytes):
-        ev, ts, vinf = self.vad.process_frame(frame, 48000)
-        counters = self.state.setdefault('vad_counters', {
-            'vad_starts_total': 0,
-            'vad_stops_allowed': 0,
-            'vad_suppressed_guard': 0,
-            'vad_suppressed_energy': 0,
-            'vad_suppressed_minframes': 0,
-        })
-        now_ms = int(time.time() * 1000)
-        # Compute RMS for profiling/feature forwarding
+        # Dual-signal (VAD + interim) gating for local stop; read once, changes require a restart
+        self._require_interim = os.environ.get('LOCAL_STOP_REQUIRE_INTERIM', 'true').lower() not in ('0','false','no')
         try:
-            arr = np.frombuffer(frame, dtype=np.int16)
-            rms_prof = float(np.sqrt(np.mean((arr.astype(np.float64))**2))) if arr.size > 0 else 0.0
+            self._interim_win_ms = int(os.environ.get('LOCAL_STOP_INTERIM_WINDOW_MS', '600'))
         except Exception:
-            rms_prof = 0.0
-        # Forward VAD feature (RMS) to Orchestrator if connected
-        # Use run_coroutine_threadsafe since on_frame is called from audio thread
+            self._interim_win_ms = 600
+        try:
+            self._min_interim_len = int(os.environ.get('LOCAL_STOP_MIN_INTERIM_LEN', '10'))
+        except Exception:
+            self._min_interim_len = 10
+        self._stt_suppression_until = 0  # Cooldown timestamp after suppression
+        self._rms_p90_cache = None  # p90 of rms_samples until the next sample
+        # Ensure per-utterance counters exist in state and bind them once; they are reset in
+        # place at utterance start, so these references stay valid
+        self.state.setdefault('vad_counters', {'vad_starts_total': 0, 'vad_stops_allowed': 0, 'vad_suppressed_guard': 0, 'vad_suppressed_energy': 0, 'vad_suppressed_minframes': 0})
+        self.counters = self.state['vad_counters']
+        self._rms_samples = self.state.setdefault('rms_samples', SampleWindow(RMS_SAMPLES_MAX))
+
+    def on_frame(self, frame: bytes, arr: np.ndarray | None = None):
+        # Sample the clock once per frame; wall-clock ms because it is compared with
+        # speaking_armed_ts_ms and emitted as ts_ms on WS events
+        now_ms = _now_ts_ms()
+        ev, ts, vinf = self.vad.process_frame(frame, 48000, now_ms, arr)
+        counters = self.counters
+        # Frame RMS was already computed by the VAD; reuse it for profiling/feature forwarding
+        rms_prof = vinf.get('rms', 0.0)
+        # Forward VAD feature (RMS) to Orchestrator if connected. record_feature only stores the
+        # latest value (the client's feature loop sends it), so no per-frame loop hop is needed.
         try:
             orch = self.state.get('orch_client')
             if orch is not None:
-                asyncio.run_coroutine_threadsafe(orch.send_feature(rms_prof), self.loop)
+                orch.record_feature(rms_prof)
         except Exception:
             pass
         if self.state.get('speaking', False):
             last_sample = self.state.get('rms_last_sample_ts', 0)
             if now_ms - int(last_sample) >= 1000:
-                self.state.setdefault('rms_samples', []).append(rms_prof)
+                self._rms_samples.append(rms_prof)
+                self._rms_p90_cache = None
                 self.state['rms_last_sample_ts'] = now_ms
 
         if vinf.get('prestart'):
@@ -444,11 +762,7 @@ class VADManager:
         if ev == 'start':
             counters['vad_starts_total'] += 1
             # Compute gate inputs
-            try:
-                arr = np.frombuffer(frame, dtype=np.int16)
-                rms = float(np.sqrt(np.mean((arr.astype(np.float64))**2))) if arr.size > 0 else 0.0
-            except Exception:
-                rms = 0.0
+            rms = rms_prof
             guard_ok = False
             try:
                 armed_ts = int(self.state.get('speaking_armed_ts_ms', 0) or 0)
@@ -466,29 +780,28 @@ class VADManager:
             dyn_thresh = min_rms
             if is_tts_active:
                 try:
-                    rms_vals = self.state.get('rms_samples') or []
+                    rms_vals = self._rms_samples
                     if rms_vals:
-                        vv = sorted(rms_vals)
-                        k = max(0, min(len(vv)-1, int(round(0.9*(len(vv)-1)))))
-                        p90 = float(vv[k])
+                        # Recompute only when a sample was added (appending clears the cache)
+                        p90 = self._rms_p90_cache
+                        if p90 is None:
+                            p90 = float(np.percentile(rms_vals.values(), 90, method="nearest"))
+                            self._rms_p90_cache = p90
                         dyn_thresh = max(min_rms, p90 * 1.5 + 200.0)
                 except Exception:
                     dyn_thresh = min_rms
             # Dual-signal agreement: require a recent interim while speaking (optional)
-            require_interim = os.environ.get('LOCAL_STOP_REQUIRE_INTERIM', 'true').lower() not in ('0','false','no')
             interim_ok = True
-            if require_interim and is_tts_active:
+            if self._require_interim and is_tts_active:
                 last_interim_ts = int(self.state.get('stt_last_interim_ts_ms', 0) or 0)
                 last_interim_len = int(self.state.get('stt_last_interim_len', 0) or 0)
-                interim_win_ms = int(os.environ.get('LOCAL_STOP_INTERIM_WINDOW_MS', '600'))
-                min_interim_len = int(os.environ.get('LOCAL_STOP_MIN_INTERIM_LEN', '10'))
-                interim_ok = (now_ms - last_interim_ts) <= interim_win_ms and last_interim_len >= min_interim_len
+                interim_ok = (now_ms - last_interim_ts) <= self._interim_win_ms and last_interim_len >= self._min_interim_len
             payload_extra = {"rms": int(rms), "rms_threshold": int(min_rms), "dyn_threshold": int(dyn_thresh), "guard_ok": guard_ok, "speaking_armed": self.state.get('speaking_armed', False), "speaking_armed_ts_ms": self.state.get('speaking_armed_ts_ms', 0), "tts_active": is_tts_active, "interim_ok": interim_ok}
             # Log VAD start with context about whether we're in TTS or listening mode
             log_event("vad_start_fired", session_id=self.session_id, metrics=payload_extra)
             # WS: vad_start
             evt = {"type": "vad_start", "ts_ms": ts, "session_id": self.session_id, "utterance_id": self.state.get('active_utterance_id', ''), "payload": {"source": "candidate_audio", **payload_extra}}
-            self.loop.call_soon_threadsafe(self.ws_queue.put_nowait, evt)
+            self.loop.call_soon_threadsafe(enqueue_ws, self.ws_queue, evt)
             # Gated stop
             self.state['last_vad_ts_ms'] = ts
             # Enterprise: VAD-bounded utterance start (if not in continuous mode)
@@ -497,21 +810,20 @@ class VADManager:
             # Check cooldown from previous suppression
             in_cooldown = now_ms < self._stt_suppression_until
             try:
-                log_event("debug_vad_start_stt_check", session_id=self.session_id, metrics={
-                    "stt_continuous": self._stt_continuous,
-                    "stt_client_exists": self.stt_client is not None,
-                    "in_utterance": self._in_utterance,
-                    "rms": int(rms),
-                    "stt_min_rms": int(stt_min_rms),
-                    "in_cooldown": in_cooldown,
-                })
+                _log_event_token(_EV_VAD_START_STT_CHECK, self.session_id,
+                                 self._stt_continuous,
+                                 self.stt_client is not None,
+                                 self._in_utterance,
+                                 int(rms),
+                                 int(stt_min_rms),
+                                 in_cooldown)
                 if not self._stt_continuous and self.stt_client is not None and not self._in_utterance:
                     # Only start utterance if RMS indicates real speech, not background noise
                     # Strong RMS (2x threshold) can break through cooldown
                     rms_ok = rms >= stt_min_rms and (not in_cooldown or rms >= stt_min_rms * 2)
                     if rms_ok:
                         self._in_utterance = True
-                        utt_id = f"utt-{int(time.time()*1000)}"
+                        utt_id = f"utt-{now_ms}"
                         self.state['active_utterance_id'] = utt_id
                         log_event("debug_stt_starting_utterance", session_id=self.session_id, metrics={"utt_id": utt_id, "rms": int(rms)})
                         # Flush ring pre-speech into batcher
@@ -521,8 +833,8 @@ class VADManager:
                                 ds = downsample_48k_to_16k(flushed)
                                 if self.frame_batcher is not None:
                                     self.frame_batcher.add(ds)
-                        # Use run_coroutine_threadsafe since on_frame is called from audio thread
-                        asyncio.run_coroutine_threadsafe(self.stt_client.start_utterance(utt_id), self.loop)
+                        # on_frame runs on the audio thread; STT calls go through the ordered loop queue
+                        self.stt_calls.submit(self.stt_client.start_utterance, utt_id)
                     else:
                         # Reset VAD state so it can fire a new 'start' when real speech comes
                         self.vad.speaking = False
@@ -565,23 +877,32 @@ class VADManager:
                     log_event("vad_start_suppressed", session_id=self.session_id, utterance_id=self.state.get('active_utterance_id', ''), reason="interim", metrics=payload_extra)
         elif ev == 'end':
             evt = {"type": "vad_end", "ts_ms": ts, "session_id": self.session_id, "utterance_id": self.state.get('active_utterance_id', ''), "payload": {"source": "candidate_audio"}}
-            self.loop.call_soon_threadsafe(self.ws_queue.put_nowait, evt)
+            self.loop.call_soon_threadsafe(enqueue_ws, self.ws_queue, evt)
             # Enterprise: VAD-bounded utterance end (if not in continuous mode)
-            # Use run_coroutine_threadsafe since on_frame is called from audio thread
+            # on_frame runs on the audio thread; STT calls go through the ordered loop queue
             try:
                 if not self._stt_continuous and self.stt_client is not None and self._in_utterance:
                     # Flush remaining batched audio
                     if self.frame_batcher is not None:
                         rem = self.frame_batcher.flush()
                         if rem:
-                            asyncio.run_coroutine_threadsafe(self.stt_client.send_audio(rem), self.loop)
-                    asyncio.run_coroutine_threadsafe(self.stt_client.end_utterance(), self.loop)
+                            self.stt_calls.submit(self.stt_client.send_audio, rem)
+                    self.stt_calls.submit(self.stt_client.end_utterance)
                     self._in_utterance = False
             except Exception:
                 pass
 
 
 class TTSMetrics:
+    # Fixed slots: one instance per utterance, touched on every queued/sent frame
+    __slots__ = (
+        'tts_started_ts_ms', 'tts_request_sent_ts_ms', 'elevenlabs_headers_ts_ms',
+        'elevenlabs_first_chunk_ts_ms', 'prebuffer_done_ts_ms', 'first_frame_sent_ts_ms',
+        'producer_first_frame_queued_ts_ms', 'producer_total_chunks', 'producer_total_bytes',
+        'producer_stream_start_ts_ms', 'producer_stream_end_ts_ms', 'queue_peak_frames',
+        'queue_sum', 'queue_samples', 'underruns', 'send_start_mono',
+    )
+
     def __init__(self, tts_started_ts_ms: int | None = None):
         self.tts_started_ts_ms = tts_started_ts_ms
         self.tts_request_sent_ts_ms = None
@@ -600,41 +921,43 @@ class TTSMetrics:
         self.underruns = 0
         self.send_start_mono = None
 
-    def mark_request_sent(self):
-        self.tts_request_sent_ts_ms = int(time.time() * 1000)
+    def mark_request_sent(self, now_ms: int | None = None):
+        self.tts_request_sent_ts_ms = now_ms if now_ms is not None else _now_ts_ms()
 
-    def mark_headers(self):
-        self.elevenlabs_headers_ts_ms = int(time.time() * 1000)
+    def mark_headers(self, now_ms: int | None = None):
+        self.elevenlabs_headers_ts_ms = now_ms if now_ms is not None else _now_ts_ms()
 
-    def mark_first_chunk(self, length: int):
-        ts = int(time.time() * 1000)
+    def mark_first_chunk(self, length: int, now_ms: int | None = None):
+        ts = now_ms if now_ms is not None else _now_ts_ms()
         self.elevenlabs_first_chunk_ts_ms = ts
         if self.producer_stream_start_ts_ms is None:
             self.producer_stream_start_ts_ms = ts
 
-    def mark_producer_first_frame_queued(self):
+    def mark_producer_first_frame_queued(self, now_ms: int | None = None):
         if self.producer_first_frame_queued_ts_ms is None:
-            self.producer_first_frame_queued_ts_ms = int(time.time() * 1000)
+            self.producer_first_frame_queued_ts_ms = now_ms if now_ms is not None else _now_ts_ms()
 
     def add_chunk(self, length: int):
         self.producer_total_chunks += 1
-        self.producer_total_bytes += int(length)
+        self.producer_total_bytes += length
 
-    def mark_stream_end(self):
-        self.producer_stream_end_ts_ms = int(time.time() * 1000)
+    def mark_stream_end(self, now_ms: int | None = None):
+        self.producer_stream_end_ts_ms = now_ms if now_ms is not None else _now_ts_ms()
 
-    def mark_prebuffer_done(self):
-        self.prebuffer_done_ts_ms = int(time.time() * 1000)
+    def mark_prebuffer_done(self, now_ms: int | None = None):
+        self.prebuffer_done_ts_ms = now_ms if now_ms is not None else _now_ts_ms()
 
-    def mark_first_frame_sent(self):
-        self.first_frame_sent_ts_ms = int(time.time() * 1000)
+    def mark_first_frame_sent(self, now_ms: int | None = None):
+        self.first_frame_sent_ts_ms = now_ms if now_ms is not None else _now_ts_ms()
 
     def begin_send_timing(self):
         self.send_start_mono = time.monotonic()
 
     def add_queue_sample(self, qsize: int):
-        self.queue_peak_frames = max(self.queue_peak_frames, int(qsize))
-        self.queue_sum += int(qsize)
+        # Called once per sent frame; qsize is already an int
+        if qsize > self.queue_peak_frames:
+            self.queue_peak_frames = qsize
+        self.queue_sum += qsize
         self.queue_samples += 1
 
     def inc_underrun(self):
@@ -680,22 +1003,62 @@ def attach_candidate_vad(transport, ws_queue, session_id, loop, vad, stop_event,
                          stt_client=None, ring_buffer=None, frame_batcher=None):
     """Register a candidate-audio VAD callback; bridge to asyncio with call_soon_threadsafe."""
     frame_bytes = int(48000 * 0.02) * 2  # 20ms @48k, 16-bit mono
-    buf = bytearray()
+    buf = FrameSlicer(frame_bytes)
     frame_count = [0]  # Use list for nonlocal mutation in nested function
     manager = VADManager(loop, ws_queue, session_id, stop_event, state, vad)
     # Wire STT helpers to VADManager (these were passed in but never assigned)
     manager.stt_client = stt_client
+    # One ordered loop queue for every STT call made from the audio thread, so start/audio/end
+    # cannot be reordered and the loop is not woken once per chunk
+    stt_calls = LoopCallQueue(loop) if stt_client is not None else None
+    manager.stt_calls = stt_calls
+    state['stt_calls'] = stt_calls  # closed by main() at shutdown
     manager.ring_buffer = ring_buffer
     manager.frame_batcher = frame_batcher
 
     started_stream = [False]
 
-    # Track RMS after format conversion for diagnostics
-    processed_rms_samples = []
+    # Per-session tunables; read once here rather than on every 20ms callback
+    try:
+        input_gain = float(os.environ.get('AUDIO_INPUT_GAIN', '1.0'))
+    except Exception:
+        input_gain = 1.0
+    try:
+        stt_silence_floor = int(os.environ.get('STT_SILENCE_RMS_FLOOR', '20'))
+    except Exception:
+        stt_silence_floor = 20
+    stt_silence_floor_sq = stt_silence_floor * stt_silence_floor
+
+    # Reusable float32/int16 scratch for format conversion and gain; grown on demand.
+    # Safe to reuse across callbacks: frames leave handle_frame as bytes copies.
+    scratch = [np.empty(4096, dtype=np.float32), np.empty(4096, dtype=np.int16)]
+
+    def _scratch(n):
+        if scratch[0].size < n:
+            scratch[0] = np.empty(n, dtype=np.float32)
+            scratch[1] = np.empty(n, dtype=np.int16)
+        return scratch[0][:n], scratch[1][:n]
+
+    # Track RMS after format conversion for diagnostics (last 100 frames)
+    processed_rms_samples = deque(maxlen=100)
     processed_rms_max = [0]
 
+    def submit_ready_chunks():
+        # Hand every ready batch to the loop as a single call
+        chunk = frame_batcher.emit_ready()
+        if not chunk:
+            return
+        chunks = [chunk]
+        chunk = frame_batcher.emit_ready()
+        while chunk:
+            chunks.append(chunk)
+            chunk = frame_batcher.emit_ready()
+        if len(chunks) == 1:
+            stt_calls.submit(stt_client.send_audio, chunks[0])
+        else:
+            stt_calls.submit(_stt_send_chunks, stt_client, chunks)
+
     def handle_frame(pcm_bytes, sample_rate=48000, channels=1):
-        nonlocal buf
         frame_count[0] += 1
         # Log every 500 frames (~10 seconds) to confirm we're receiving audio
         if frame_count[0] == 1:
@@ -704,14 +1067,13 @@ def attach_candidate_vad(transport, ws_queue, session_id, loop, vad, stop_event,
             expected_float32_samples = len(pcm_bytes) // 4
             # Try both interpretations
             try:
-                arr_i16 = np.frombuffer(pcm_bytes, dtype=np.int16)
-                rms_i16 = float(np.sqrt(np.mean(arr_i16.astype(np.float64)**2))) if arr_i16.size > 0 else 0
+                rms_i16 = rms_int16(pcm_bytes)
             except:
                 rms_i16 = -1
             try:
                 arr_f32 = np.frombuffer(pcm_bytes, dtype=np.float32)
-                # Convert float32 [-1,1] to int16 scale for comparison
-                rms_f32_scaled = float(np.sqrt(np.mean((arr_f32 * 32767)**2))) if arr_f32.size > 0 else 0
+                # Convert float32 [-1,1] RMS to int16 scale for comparison (one dot pass, no temporaries)
+                rms_f32_scaled = 32767 * float(np.sqrt(np.dot(arr_f32, arr_f32) / arr_f32.size)) if arr_f32.size > 0 else 0
             except:
                 rms_f32_scaled = -1
             log_event("remote_audio_first_frame", metrics={
@@ -726,36 +1088,41 @@ def attach_candidate_vad(transport, ws_queue, session_id, loop, vad, stop_event,
         bytes_per_sample = len(pcm_bytes) // (sample_rate * channels // 50)  # 20ms frame
         if bytes_per_sample == 4:
             # Float32 format - convert to int16
-            pcm_arr = np.frombuffer(pcm_bytes, dtype=np.float32)
-            pcm_arr = (pcm_arr * 32767).clip(-32768, 32767).astype(np.int16)
+            src_f32 = np.frombuffer(pcm_bytes, dtype=np.float32)
+            f32, pcm_arr = _scratch(src_f32.size)
+            np.multiply(src_f32, 32767, out=f32)
+            np.clip(f32, -32768, 32767, out=f32)
+            np.copyto(pcm_arr, f32, casting='unsafe')
         else:
             # Assume int16
             pcm_arr = np.frombuffer(pcm_bytes, dtype=np.int16)
 
         # Apply input gain to boost quiet user audio - only when TTS is NOT active
         # to avoid amplifying the bot's own echo during TTS playback
-        input_gain = float(os.environ.get('AUDIO_INPUT_GAIN', '1.0'))
         tts_active = state.get('speaking', False)
         if input_gain != 1.0 and pcm_arr.size > 0 and not tts_active:
-            pcm_arr = (pcm_arr.astype(np.float32) * input_gain).clip(-32768, 32767).astype(np.int16)
+            f32, out_i16 = _scratch(pcm_arr.size)
+            np.multiply(pcm_arr, input_gain, out=f32, casting='unsafe')
+            np.clip(f32, -32768, 32767, out=f32)
+            np.copyto(out_i16, f32, casting='unsafe')
+            pcm_arr = out_i16
         if channels == 2 and pcm_arr.size % 2 == 0:
-            pcm_arr = pcm_arr.reshape(-1, 2).mean(axis=1).astype(np.int16)
+            pcm_arr = downmix_stereo_int16(pcm_arr)
         if sample_rate != 48000 and pcm_arr.size > 0:
             pcm_arr = resample_to_48k(pcm_arr, sample_rate)
 
         # Track RMS after all format conversions for diagnostics
         try:
-            if pcm_arr.size > 0:
-                rms_processed = float(np.sqrt(np.mean(pcm_arr.astype(np.float64)**2)))
+            if _LOG_AUDIO_PROCESSED_RMS and pcm_arr.size > 0:
+                rms_processed = rms_int16(pcm_arr)
                 processed_rms_samples.append(rms_processed)
-                if len(processed_rms_samples) > 100:
-                    processed_rms_samples.pop(0)
                 if rms_processed > processed_rms_max[0]:
                     processed_rms_max[0] = rms_processed
-                # Log every 100 frames with processed RMS stats
+                # Log every 100 frames with processed RMS stats; one pass over the window per
+                # emit is O(1) amortized per frame, so no running aggregates are kept
                 if frame_count[0] % 100 == 0:
-                    rms_avg = sum(processed_rms_samples) / len(processed_rms_samples) if processed_rms_samples else 0
-                    rms_recent_max = max(processed_rms_samples) if processed_rms_samples else 0
+                    rms_avg = sum(processed_rms_samples) / len(processed_rms_samples)
+                    rms_recent_max = max(processed_rms_samples)
                     log_event("audio_processed_rms", metrics={
                         "frame": frame_count[0],
                         "rms_current": int(rms_processed),
@@ -767,53 +1134,44 @@ def attach_candidate_vad(transport, ws_queue, session_id, loop, vad, stop_event,
         except Exception:
             pass
 
-        b = pcm_arr.tobytes()
-        buf.extend(b)
-        while len(buf) >= frame_bytes:
-            frame = bytes(buf[:frame_bytes])
-            del buf[:frame_bytes]
+        buf.push(pcm_arr.tobytes())
+        for frame in buf.frames():
+            # One zero-copy int16 view per frame, shared by the STT gate, downsampler and VAD
+            frame_arr = np.frombuffer(frame, dtype=np.int16)
             # Always push frame to ring buffer for STT
             try:
                 if ring_buffer is not None:
                     ring_buffer.push(frame)
             except Exception:
                 pass
-            # Stream frame to STT sidecar
-            # Use run_coroutine_threadsafe since handle_frame is called from audio callback thread
+            # Stream frame to STT sidecar (handle_frame runs on the audio callback thread)
             try:
                 if stt_client is not None and frame_batcher is not None:
                     if manager._stt_continuous:
                         # Continuous: single long-form utterance
                         if not started_stream[0]:
                             started_stream[0] = True
-                            utt = f"utt-{int(time.time()*1000)}"
-                            asyncio.run_coroutine_threadsafe(stt_client.start_utterance(utt), loop)
+                            utt = f"utt-{_now_ts_ms()}"
+                            stt_calls.submit(stt_client.start_utterance, utt)
                         # Silence gating when not in VAD utterance to avoid filling provider queue with near-zero frames
-                        stt_silence_floor = int(os.environ.get('STT_SILENCE_RMS_FLOOR', '20'))
+                        # Compare energy in the squared domain; the RMS value itself is not needed here
                         try:
-                            arrf = np.frombuffer(frame, dtype=np.int16)
-                            frms = float(np.sqrt(np.mean(arrf.astype(np.float64)**2))) if arrf.size > 0 else 0.0
+                            fms = mean_square_int16(frame_arr)
                         except Exception:
-                            frms = 0.0
-                        if manager._in_utterance or frms >= stt_silence_floor:
-                            ds = downsample_48k_to_16k(frame)
+                            fms = 0.0
+                        if manager._in_utterance or fms >= stt_silence_floor_sq:
+                            ds = downsample_48k_to_16k(frame_arr)
                             frame_batcher.add(ds)
-                        chunk = frame_batcher.emit_ready()
-                        while chunk:
-                            asyncio.run_coroutine_threadsafe(stt_client.send_audio(chunk), loop)
-                            chunk = frame_batcher.emit_ready()
+                        submit_ready_chunks()
                     else:
                         # VAD-bounded: only stream during active utterance
                         if manager._in_utterance:
-                            ds = downsample_48k_to_16k(frame)
+                            ds = downsample_48k_to_16k(frame_arr)
                             frame_batcher.add(ds)
-                            chunk = frame_batcher.emit_ready()
-                            while chunk:
-                                asyncio.run_coroutine_threadsafe(stt_client.send_audio(chunk), loop)
-                                chunk = frame_batcher.emit_ready()
+                            submit_ready_chunks()
             except Exception:
                 pass
-            manager.on_frame(frame)
+            manager.on_frame(frame, frame_arr)
 
     # Try to register callback on transport
     if hasattr(transport, 'on_remote_audio'):
@@ -840,53 +1198,56 @@ async def playback_task(transport, pcm16_bytes, sr, stop_event, loop, ws_queue,
     bytes_per_frame = samples_per_frame * bytes_per_sample
     pos = 0
     sent_frames = 0
-    started_ms = int(time.time() * 1000)
+    started_ms = _now_ts_ms()
     method = 'unknown'
     # Precise pacing using monotonic clock
-    frame_duration = 0.02
-    next_frame_time = time.monotonic()
+    next_frame_ns = time.monotonic_ns()
     tm = TTSMetrics(state.get('tts_started_ts_ms'))
     tm.begin_send_timing()
-
-    while pos < len(pcm16_bytes):
-        if stop_event.is_set():
-            break
-        now = time.monotonic()
-        sleep_time = next_frame_time - now
-        if sleep_time > 0:
+    # Resolve the transport's send method once rather than per frame
+    send_fn = getattr(transport, 'send_audio_pcm16', None)
+    send_method = 'send_audio_pcm16'
+    if send_fn is None:
+        send_fn = getattr(transport, 'send_audio', None)
+        send_method = 'send_audio'
+
+    # One stop waiter reused for every frame's early-wake sleep (no wait_for timeout exception per frame)
+    stop_wait = asyncio.ensure_future(stop_event.wait())
+    try:
+        while pos < len(pcm16_bytes):
+            if stop_event.is_set():
+                break
+            sleep_ns = next_frame_ns - time.monotonic_ns()
+            # Only sleep if meaningful
+            if sleep_ns > _MIN_SLEEP_NS:
+                await asyncio.wait((stop_wait,), timeout=sleep_ns / 1e9)
+                if stop_wait.done():
+                    break
+            # If we're behind, catch up without extra sleep
+            next_frame_ns += _FRAME_NS
+            chunk = pcm16_bytes[pos:pos + bytes_per_frame]
+            pos += bytes_per_frame
+            if not chunk:
+                break
             try:
-                # Only sleep if meaningful
-                if sleep_time > 0.005:
-                    await asyncio.wait_for(stop_event.wait(), timeout=sleep_time)
-            except asyncio.TimeoutError:
-                pass
-        # If we're behind, catch up without extra sleep
-        next_frame_time += frame_duration
-        chunk = pcm16_bytes[pos:pos + bytes_per_frame]
-        pos += bytes_per_frame
-        if not chunk:
-            break
-        try:
-            if hasattr(transport, 'send_audio_pcm16'):
-                transport.send_audio_pcm16(chunk, sample_rate=sr)
-                method = 'send_audio_pcm16'
-            elif hasattr(transport, 'send_audio'):
-                transport.send_audio(chunk, sample_rate=sr)
-                method = 'send_audio'
-            else:
-                raise RuntimeError('transport has no audio send method')
-            sent_frames += 1
-            if sent_frames == 1:
-                # Arm local-stop after first frame and record ts
-                state['speaking_armed'] = True
-                state['speaking_armed_ts_ms'] = int(time.time() * 1000)
-                log_event("tts_first_frame_sent", session_id=session_id or "", utterance_id=utterance_id, metrics={"len": len(chunk)})
-                tm.mark_first_frame_sent()
-        except Exception as e:
-            eprint("publish error:", e)
-            raise
+                if send_fn is None:
+                    raise RuntimeError('transport has no audio send method')
+                send_fn(chunk, sample_rate=sr)
+                method = send_method
+                sent_frames += 1
+                if sent_frames == 1:
+                    # Arm local-stop after first frame and record ts
+                    state['speaking_armed'] = True
+                    state['speaking_armed_ts_ms'] = _now_ts_ms()
+                    log_event("tts_first_frame_sent", session_id=session_id or "", utterance_id=utterance_id, metrics={"len": len(chunk)})
+                    tm.mark_first_frame_sent(state['speaking_armed_ts_ms'])
+            except Exception as e:
+                eprint("publish error:", e)
+                raise
+    finally:
+        stop_wait.cancel()
 
-    duration_ms = int(time.time() * 1000) - started_ms
+    duration_ms = _now_ts_ms() - started_ms
     log_event("audio_publish_summary", metrics={
         "sr": sr,
         "channels": 1,
@@ -901,7 +1262,7 @@ async def playback_task(transport, pcm16_bytes, sr, stop_event, loop, ws_queue,
     # WS: tts_stopped (reason determined by stop_event)
     reason = "interrupted" if stop_event.is_set() else "completed"
     if session_id and not state.get('tts_stop_emitted', False):
-        now_ts = int(time.time() * 1000)
+        now_ts = _now_ts_ms()
         payload = {"source": "worker_local", "reason": reason}
         vad_ts = state.get('last_vad_ts_ms')
         if reason == 'interrupted' and isinstance(vad_ts, (int, float)) and vad_ts > 0:
@@ -910,7 +1271,7 @@ async def playback_task(transport, pcm16_bytes, sr, stop_event, loop, ws_queue,
         tm.add_to_payload_and_log(payload, session_id, utterance_id, sent_frames)
         evt = {"type": "tts_stopped", "ts_ms": now_ts, "session_id": session_id, "utterance_id": utterance_id, "payload": payload}
         state['tts_stop_emitted'] = True
-        await ws_queue.put(evt)
+        enqueue_ws(ws_queue, evt)
         try:
             orch = state.get('orch_client')
             if orch is not None:
@@ -921,6 +1282,11 @@ async def playback_task(transport, pcm16_bytes, sr, stop_event, loop, ws_queue,
     state['speaking_armed'] = False
 
 
+_U32LE = struct.Struct('<I')
+_U16LE = struct.Struct('<H')
+_WAV_COMPACT_BYTES = 64 * 1024
+
+
 class WavStreamParser:
     """Minimal streaming WAV parser for PCM16. Produces raw PCM16 bytes.
     Assumes little-endian PCM. Converts stereo to mono by averaging.
@@ -939,12 +1305,11 @@ class WavStreamParser:
         self.buf.extend(data)
 
     def _read_u32le(self, off):
-        b = self.buf[off:off+4]
-        return int.from_bytes(b, 'little')
+        # unpack_from reads the bytearray in place; no slice copy
+        return _U32LE.unpack_from(self.buf, off)[0]
 
     def _read_u16le(self, off):
-        b = self.buf[off:off+2]
-        return int.from_bytes(b, 'little')
+        return _U16LE.unpack_from(self.buf, off)[0]
 
     def parse_header(self):
         if self.header_parsed:
@@ -989,29 +1354,34 @@ class WavStreamParser:
     def read_pcm_bytes(self, max_bytes=None):
         if not self.header_parsed:
             return b''
-        if max_bytes is None:
-            max_bytes = len(self.buf)
-        out = bytes(self.buf[:max_bytes])
-        del self.buf[:max_bytes]
+        start = self._cursor
+        end = len(self.buf) if max_bytes is None else min(len(self.buf), start + max_bytes)
+        with memoryview(self.buf) as mv:
+            out = bytes(mv[start:end])
+        if end == len(self.buf):
+            self.buf.clear()
+            self._cursor = 0
+        elif end >= _WAV_COMPACT_BYTES:
+            # Amortized compaction instead of a memmove of the unread tail on every read
+            del self.buf[:end]
+            self._cursor = 0
+        else:
+            self._cursor = end
         return out
 
 
 def pcm_stereo_to_mono(pcm: np.ndarray) -> np.ndarray:
     if pcm.ndim == 1:
         return pcm
-    return pcm.reshape(-1, 2).mean(axis=1).astype(np.int16)
+    return downmix_stereo_int16(pcm.reshape(-1))
 
 
-def slice_frames(pcm16_bytes: bytearray, frame_bytes: int):
-    while len(pcm16_bytes) >= frame_bytes:
-        chunk = bytes(pcm16_bytes[:frame_bytes])
-        del pcm16_bytes[:frame_bytes]
-        yield chunk
+async def _producer_stream_elevenlabs(eleven_api_key, voice_id, text, queue, stop_flag: threading.Event, metrics,
+                                      prebuffer_evt: asyncio.Event | None = None, prebuffer_target: int = 0):
+    """Async producer: streams raw PCM from ElevenLabs and pushes 20ms PCM16@48k frames to an asyncio.Queue with backpressure.
 
-
-def _producer_stream_elevenlabs(eleven_api_key, voice_id, text, loop, queue, stop_flag: threading.Event, metrics):
-    """Blocking producer: streams raw PCM from ElevenLabs and pushes 20ms PCM16@48k frames via the loop to an asyncio.Queue with backpressure."""
-    import requests
+    Sets prebuffer_evt once the queue holds prebuffer_target frames.
+    """
     # Use native 48kHz PCM format - no resampling needed
     pcm_sample_rate = 48000
     url = f"https://api.elevenlabs.io/v1/text-to-speech/{voice_id}/stream?output_format=pcm_48000"
@@ -1021,18 +1391,20 @@ def _producer_stream_elevenlabs(eleven_api_key, voice_id, text, loop, queue, sto
     }
     data = {"text": text}
     frame_bytes_48k = int(48000 * 0.02) * 2  # 20ms @ 48kHz, 16-bit = 1920 bytes
-    out_buf = bytearray()
-    raw_buf = bytearray()  # Buffer for unaligned incoming bytes
+    # Frames are cut at even byte offsets, so an odd HTTP chunk boundary just waits in the
+    # slicer with the rest of the partial frame; no separate int16 alignment buffer is needed
+    out_buf = FrameSlicer(frame_bytes_48k)
     # Mark request start for timing breakdown
     metrics.mark_request_sent()
     log_event("tts_producer_http_request_start")
     chunk_count = 0
     try:
-        with requests.post(url, headers=headers, data=json.dumps(data), stream=True, timeout=30) as resp:
+        async with _tts_http_client().stream("POST", url, headers=headers, json=data) as resp:
             log_event("tts_producer_http_response", metrics={"status": resp.status_code})
             metrics.mark_headers()
             resp.raise_for_status()
-            for chunk in resp.iter_content(chunk_size=4096):
+            # No fixed chunk_size: httpx would hold bytes back until a full chunk arrived
+            async for chunk in resp.aiter_bytes():
                 chunk_count += 1
                 if chunk_count == 1:
                     log_event("tts_producer_first_chunk", metrics={"len": len(chunk)})
@@ -1042,42 +1414,29 @@ def _producer_stream_elevenlabs(eleven_api_key, voice_id, text, loop, queue, sto
                     break
                 if not chunk:
                     continue
-                # Buffer raw bytes to ensure 2-byte alignment for int16
-                raw_buf.extend(chunk)
                 # Update producer metrics
                 metrics.add_chunk(len(chunk))
-                aligned_len = (len(raw_buf) // 2) * 2
-                if aligned_len == 0:
-                    continue
-                aligned_bytes = bytes(raw_buf[:aligned_len])
-                del raw_buf[:aligned_len]
                 # Native 48kHz PCM16 - no resampling needed
-                out_buf.extend(aligned_bytes)
+                out_buf.push(chunk)
                 # Emit complete 20ms frames with backpressure
-                for frm in slice_frames(out_buf, frame_bytes_48k):
+                for frm in out_buf.frames():
                     if metrics.producer_first_frame_queued_ts_ms is None:
                         metrics.mark_producer_first_frame_queued()
                         log_event("tts_producer_first_frame_queued")
-                    fut = asyncio.run_coroutine_threadsafe(queue.put(frm), loop)
-                    try:
-                        fut.result()  # backpressure
-                    except Exception as e:
-                        log_event("tts_queue_put_failed", metrics={"error": str(e)})
-                        return
+                    await queue.put(frm)  # backpressure
+                    if prebuffer_evt is not None and queue.qsize() >= prebuffer_target:
+                        prebuffer_evt.set()
             log_event("tts_producer_http_stream_finished")
             metrics.mark_stream_end()
-            # Send sentinel to signal completion
-            fut = asyncio.run_coroutine_threadsafe(queue.put(None), loop)
-            try:
-                fut.result()
-            except Exception:
-                pass
+        # Send sentinel to signal completion
+        await queue.put(None)
+    except asyncio.CancelledError:
+        raise
     except Exception as e:
         log_event("tts_producer_exception", metrics={"error": str(e)})
         # Send sentinel even on error
         try:
-            fut = asyncio.run_coroutine_threadsafe(queue.put(None), loop)
-            fut.result()
+            await queue.put(None)
         except Exception:
             pass
 
@@ -1090,31 +1449,35 @@ async def tts_streaming_play(loop, transport, eleven_api_key, voice_id, text, st
     tm = TTSMetrics(state.get('tts_started_ts_ms'))
     stop_flag = threading.Event()
 
-    def start_producer():
+    # Prebuffer 10-25 frames (200-500ms) to smooth network jitter
+    prebuffer_target = int(os.environ.get('TTS_PREBUFFER_FRAMES', str(state.get('tts_prebuffer_frames_next', 15))))
+    prebuffer_target = max(10, min(25, prebuffer_target))
+    prebuffer_timeout_secs = int(os.environ.get('TTS_PREBUFFER_TIMEOUT_SECS', '30'))
+    prebuffer_evt = asyncio.Event()
+
+    async def start_producer():
         log_event("tts_producer_start", session_id=session_id or "", utterance_id=utterance_id)
-        _producer_stream_elevenlabs(eleven_api_key, voice_id, text, loop, queue, stop_flag, tm)
+        await _producer_stream_elevenlabs(eleven_api_key, voice_id, text, queue, stop_flag, tm, prebuffer_evt, prebuffer_target)
         log_event("tts_producer_finished", session_id=session_id or "", utterance_id=utterance_id)
 
-    # Start producer in threadpool
+    # Start producer as a task on this loop (no executor thread or cross-thread future per frame)
     log_event("tts_producer_launch", session_id=session_id or "", utterance_id=utterance_id)
-    prod_fut = loop.run_in_executor(None, start_producer)
+    prod_task = asyncio.create_task(start_producer())
 
-    # Prebuffer 10-25 frames (200-500ms) to smooth network jitter
-    prebuffer_target = int(os.environ.get('TTS_PREBUFFER_FRAMES', str(state.get('tts_prebuffer_frames_next', 15))))
-    prebuffer_target = max(10, min(25, prebuffer_target))
-    prebuffer_timeout_secs = int(os.environ.get('TTS_PREBUFFER_TIMEOUT_SECS', '30'))
     log_event("tts_prebuffer_wait", session_id=session_id or "", utterance_id=utterance_id, metrics={"target_frames": prebuffer_target, "timeout_s": prebuffer_timeout_secs})
-    prebuffer_timeout = time.time() + prebuffer_timeout_secs
-    while queue.qsize() < prebuffer_target and not stop_event.is_set():
-        if time.time() > prebuffer_timeout:
-            log_event("tts_prebuffer_timeout", session_id=session_id or "", utterance_id=utterance_id)
-            break
-        # Check if producer finished early (peek for None sentinel)
-        if not prod_fut.done():
-            await asyncio.sleep(0.01)
-        else:
+    # Wake once: prebuffer filled, producer finished early, barge-in, or timeout
+    prebuffer_wait = asyncio.ensure_future(prebuffer_evt.wait())
+    stop_wait = asyncio.ensure_future(stop_event.wait())
+    try:
+        await asyncio.wait({prebuffer_wait, stop_wait, prod_task}, timeout=prebuffer_timeout_secs, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        prebuffer_wait.cancel()
+        stop_wait.cancel()
+    if not prebuffer_evt.is_set() and not stop_event.is_set():
+        if prod_task.done():
             log_event("tts_producer_finished_during_prebuffer", session_id=session_id or "", utterance_id=utterance_id)
-            break
+        else:
+            log_event("tts_prebuffer_timeout", session_id=session_id or "", utterance_id=utterance_id)
     tm.add_queue_sample(queue.qsize())
     log_event("tts_prebuffer_done", session_id=session_id or "", utterance_id=utterance_id, metrics={"queue_size": queue.qsize()})
     tm.mark_prebuffer_done()
@@ -1123,9 +1486,12 @@ async def tts_streaming_play(loop, transport, eleven_api_key, voice_id, text, st
     sent_frames = 0
     first_audio_emitted = False
     completed_normally = False
-    frame_duration = 0.02  # 20ms per frame
-    next_frame_time = time.monotonic()
+    next_frame_ns = time.monotonic_ns()
     send_start_mono = None
+    # Resolve the transport's send method once rather than per frame
+    send_fn = getattr(transport, 'send_audio_pcm16', None) or getattr(transport, 'send_audio', None)
+    # One stop waiter reused for every frame's early-wake sleep (no wait_for timeout exception per frame)
+    stop_wait = asyncio.ensure_future(stop_event.wait())
 
     try:
         while not stop_event.is_set():
@@ -1137,14 +1503,14 @@ async def tts_streaming_play(loop, transport, eleven_api_key, voice_id, text, st
                 tm.inc_underrun()
                 reason = 'buffer_underrun'
                 if session_id and not state.get('tts_stop_emitted', False):
-                    now_ts = int(time.time() * 1000)
+                    now_ts = _now_ts_ms()
                     payload = {"source": "worker_local", "reason": reason}
                     vad_ts = state.get('last_vad_ts_ms')
                     if isinstance(vad_ts, (int, float)) and vad_ts > 0:
                         payload['barge_in_ms'] = max(0, now_ts - int(vad_ts))
                     evt = {"type": "tts_stopped", "ts_ms": now_ts, "session_id": session_id, "utterance_id": utterance_id, "payload": payload}
                     state['tts_stop_emitted'] = True
-                    await ws_queue.put(evt)
+                    enqueue_ws(ws_queue, evt)
                     try:
                         orch = state.get('orch_client')
                         if orch is not None:
@@ -1159,41 +1525,35 @@ async def tts_streaming_play(loop, transport, eleven_api_key, voice_id, text, st
                 break
 
             # Wait until it's time to send this frame (monotonic timing)
-            now = time.monotonic()
-            sleep_time = next_frame_time - now
-            if sleep_time > 0:
-                # Use asyncio.sleep for better event loop cooperation
-                # but check stop_event periodically for responsiveness
-                if sleep_time > 0.005:  # Only sleep if > 5ms remaining
-                    try:
-                        await asyncio.wait_for(stop_event.wait(), timeout=sleep_time)
-                        break  # stop_event was set
-                    except asyncio.TimeoutError:
-                        pass
+            sleep_ns = next_frame_ns - time.monotonic_ns()
+            # Wake early on stop_event for responsiveness
+            if sleep_ns > _MIN_SLEEP_NS:  # Only sleep if > 5ms remaining
+                await asyncio.wait((stop_wait,), timeout=sleep_ns / 1e9)
+                if stop_wait.done():
+                    break  # stop_event was set
 
             # Send frame
             try:
-                if hasattr(transport, 'send_audio_pcm16'):
-                    transport.send_audio_pcm16(frm, sample_rate=48000)
-                else:
-                    transport.send_audio(frm, sample_rate=48000)
+                if send_fn is None:
+                    raise RuntimeError('transport has no audio send method')
+                send_fn(frm, sample_rate=48000)
                 sent_frames += 1
                 if sent_frames == 1:
                     log_event("tts_first_frame_sent", session_id=session_id or "", utterance_id=utterance_id, metrics={"len": len(frm)})
                     state['speaking_armed'] = True
-                    state['speaking_armed_ts_ms'] = int(time.time() * 1000)
+                    state['speaking_armed_ts_ms'] = _now_ts_ms()
                     log_event("speaking_armed", session_id=session_id or "", utterance_id=utterance_id, metrics={"speaking_armed_ts_ms": state['speaking_armed_ts_ms']})
-                    tm.mark_first_frame_sent()
+                    tm.mark_first_frame_sent(state['speaking_armed_ts_ms'])
                     tm.emit_breakdown(session_id, utterance_id)
                     tm.begin_send_timing()
                 if not first_audio_emitted:
                     first_audio_emitted = True
                     if session_id:
-                        now_ts = int(time.time() * 1000)
+                        now_ts = _now_ts_ms()
                         tts_started_ts = state.get('tts_started_ts_ms', now_ts)
                         first_audio_ms = max(0, now_ts - int(tts_started_ts))
                         evt = {"type": "tts_first_audio", "ts_ms": now_ts, "session_id": session_id, "utterance_id": utterance_id, "payload": {"first_audio_ms": first_audio_ms}}
-                        await ws_queue.put(evt)
+                        enqueue_ws(ws_queue, evt)
                         log_event("tts_first_audio", session_id=session_id or "", utterance_id=utterance_id, metrics={"first_audio_ms": first_audio_ms})
                         try:
                             oc = state.get('orch_client')
@@ -1208,10 +1568,10 @@ async def tts_streaming_play(loop, transport, eleven_api_key, voice_id, text, st
 
             qsz = queue.qsize()
             tm.add_queue_sample(qsz)
-            next_frame_time += frame_duration  # Schedule next frame exactly 20ms later
+            next_frame_ns += _FRAME_NS  # Schedule next frame exactly 20ms later
         # Emit tts_stopped with appropriate reason and include VAD/RMS profiling
         if session_id and not state.get('tts_stop_emitted', False):
-            now_ts = int(time.time() * 1000)
+            now_ts = _now_ts_ms()
             if completed_normally:
                 reason = 'completed'
             elif stop_event.is_set():
@@ -1226,27 +1586,23 @@ async def tts_streaming_play(loop, transport, eleven_api_key, voice_id, text, st
                 log_event("barge_in_detected", session_id=session_id, utterance_id=utterance_id, metrics={"latency_ms": barge_in_ms, "path": "VAD->stop"})
             # Attach VAD suppression counters
             if isinstance(state.get('vad_counters'), dict):
-                payload['vad_counters'] = state['vad_counters']
+                # Snapshot: the counters dict is reset in place for the next utterance
+                payload['vad_counters'] = dict(state['vad_counters'])
             # Attach speaking armed ts
             if state.get('speaking_armed_ts_ms'):
                 payload['speaking_armed_ts_ms'] = int(state['speaking_armed_ts_ms'])
-            # RMS profiling percentiles
-            def _pct(values, p):
-                if not values:
-                    return 0.0
-                vv = sorted(values)
-                k = max(0, min(len(vv)-1, int(round((p/100.0)*(len(vv)-1)))))
-                return float(vv[k])
-            rms_vals = state.get('rms_samples') or []
+            # RMS profiling percentiles (nearest rank, both from one selection pass)
+            rms_vals = state.get('rms_samples')
             if rms_vals:
-                payload['rms_p50'] = _pct(rms_vals, 50)
-                payload['rms_p90'] = _pct(rms_vals, 90)
+                p50, p90 = np.quantile(rms_vals.values(), (0.5, 0.9), method="nearest")
+                payload['rms_p50'] = float(p50)
+                payload['rms_p90'] = float(p90)
             # Add drift, queue, and producer metrics
             tm.add_to_payload_and_log(payload, session_id, utterance_id, sent_frames)
 
             evt = {"type": "tts_stopped", "ts_ms": now_ts, "session_id": session_id, "utterance_id": utterance_id, "payload": payload}
             state['tts_stop_emitted'] = True
-            await ws_queue.put(evt)
+            enqueue_ws(ws_queue, evt)
             # Notify orchestrator that TTS stopped
             try:
                 orch = state.get('orch_client')
@@ -1256,6 +1612,7 @@ async def tts_streaming_play(loop, transport, eleven_api_key, voice_id, text, st
                 pass
         log_event("tts_playback_done", session_id=session_id or "", utterance_id=utterance_id, metrics={"sent_frames": sent_frames, "completed_normally": completed_normally})
     finally:
+        stop_wait.cancel()
         # Adapt prebuffer for next utterance based on underruns
         try:
             nxt = prebuffer_target
@@ -1267,33 +1624,36 @@ async def tts_streaming_play(loop, transport, eleven_api_key, voice_id, text, st
             log_event("tts_prebuffer_adapt", session_id=session_id or "", utterance_id=utterance_id, metrics={"this": prebuffer_target, "next": nxt, "underruns": tm.underruns})
         except Exception:
             pass
-        # Cancel producer
+        # Cancel producer (it may be parked on a full queue now that nothing consumes it)
         stop_flag.set()
-        with contextlib.suppress(Exception):
-            await asyncio.wait_for(prod_fut, timeout=1.0)
-        # Drain queue
-        try:
-            while True:
-                queue.get_nowait()
-        except Exception:
-            pass
+        prod_task.cancel()
+        await asyncio.wait({prod_task}, timeout=1.0)
+        # Drain queue (bounded by qsize; no exception-terminated loop)
+        for _ in range(queue.qsize()):
+            queue.get_nowait()
         # Emit queue peak metric
         if session_id:
-            now_ts = int(time.time() * 1000)
+            now_ts = _now_ts_ms()
             evt = {"type": "tts_queue_peak_frames", "ts_ms": now_ts, "session_id": session_id, "utterance_id": utterance_id, "payload": {"peak_frames": tm.queue_peak_frames}}
-            with contextlib.suppress(Exception):
-                await ws_queue.put(evt)
+            try:
+                enqueue_ws(ws_queue, evt)
+            except Exception:
+                pass
         # Disarm local-stop after playback concludes and clear stop flag for next turns
         state['speaking_armed'] = False
-        try:
-            stop_event.clear()
-        except Exception:
-            pass
+        stop_event.clear()
 
 
 class DailyTransportWrapper(daily.EventHandler):
     """Wrapper around daily-python SDK to provide a simple interface for joining rooms and sending audio."""
 
+    # Fixed slots: the audio callbacks read these on every frame
+    __slots__ = (
+        'client', 'room_url', 'token', 'mic', 'speaker', '_joined', '_joined_event', '_remote_audio_callback',
+        '_participant_joined_flag', '_user_participant_id', '_use_participant_audio',
+        '_participant_audio_frames', '_participant_stats_q',
+    )
+
     def __init__(self, room_url, token):
         super().__init__()
         daily.Daily.init()
@@ -1303,10 +1663,12 @@ class DailyTransportWrapper(daily.EventHandler):
         self.mic = None
         self.speaker = None
         self._joined = False
+        self._joined_event = threading.Event()
         self._remote_audio_callback = None
         self._participant_joined_flag = threading.Event()
         self._user_participant_id = None
         self._use_participant_audio = False  # When True, use per-participant audio instead of speaker
+        self._participant_stats_q = None  # participant-audio diagnostics hand-off (created on first renderer)
 
     def connect(self):
         # Create virtual microphone for sending audio (via Daily factory)
@@ -1327,14 +1689,8 @@ class DailyTransportWrapper(daily.EventHandler):
         # Join the room
         self.client.join(self.room_url, self.token, completion=self._on_joined)
 
-        # Wait for join (simple polling)
-        import time
-        timeout = 10
-        start = time.time()
-        while not self._joined and (time.time() - start) < timeout:
-            time.sleep(0.1)
-
-        if not self._joined:
+        # Wait for the join completion (set from _on_joined)
+        if not self._joined_event.wait(timeout=10):
             raise RuntimeError("Failed to join Daily room within timeout")
 
         # Enable the virtual microphone for publishing
@@ -1370,80 +1726,95 @@ class DailyTransportWrapper(daily.EventHandler):
 
         # Start a background reader to pull frames from the virtual speaker
         # and forward them into the VAD path via _on_speaker_audio.
+        # NumPy diagnostics (non-zero probe, RMS, stats logs) run on a second thread fed by a
+        # small bounded queue, so the reader only does the blocking read and the callback.
+        stats_q = queue.Queue(maxsize=8)
+
+        def _speaker_stats():
+            nonzero_count = 0
+            # RMS tracking for diagnostics (last 100 reads)
+            rms_samples = deque(maxlen=100)
+            rms_max = 0
+            while True:
+                data, frame_count = stats_q.get()
+                try:
+                    # One int16 view per read, shared by the non-zero probe and the RMS
+                    arr = np.frombuffer(data, dtype=np.int16)
+                    # Check if the first 50 samples have any non-zero content
+                    if arr[:50].any():
+                        nonzero_count += 1
+
+                    # Calculate RMS at speaker reader level (before any processing)
+                    rms_raw = 0
+                    if arr.size > 0:
+                        rms_raw = rms_int16(arr)
+                        rms_samples.append(rms_raw)
+                        if rms_raw > rms_max:
+                            rms_max = rms_raw
+
+                    # Log every 500 frames (~10s) with RMS stats
+                    if frame_count == 1 or frame_count % 500 == 0:
+                        rms_avg = sum(rms_samples) / len(rms_samples) if rms_samples else 0
+                        rms_recent_max = max(rms_samples) if rms_samples else 0
+                        log_event("speaker_reader_stats", metrics={
+                            "frames": frame_count,
+                            "nonzero_frames": nonzero_count,
+                            "data_len": len(data),
+                            "rms_current": int(rms_raw),
+                            "rms_avg_100": int(rms_avg),
+                            "rms_max_100": int(rms_recent_max),
+                            "rms_max_total": int(rms_max)
+                        })
+                    # Log high RMS events (potential speech)
+                    elif rms_raw > 50:
+                        log_event("speaker_high_rms", metrics={
+                            "frame": frame_count,
+                            "rms": int(rms_raw)
+                        })
+                except Exception:
+                    pass
+
         def _speaker_reader():
             try:
-                import numpy as np
                 sr = getattr(self.speaker, 'sample_rate', 48000) or 48000
                 ch = getattr(self.speaker, 'channels', 1) or 1
                 num_frames = int(sr / 100) * 2  # 20ms
-                self._speaker_read_errors = 0
-                self._speaker_frame_count = 0
-                self._speaker_nonzero_count = 0
-                # RMS tracking for diagnostics
-                self._rms_samples = []
-                self._rms_max = 0
+                drain_frames = num_frames * 5  # 100ms reads while per-participant audio is in use
+                # Reader-thread counters live in locals; only this loop touches them
+                read_frames = self.speaker.read_frames
+                read_errors = 0
+                frame_count = 0
                 log_event("speaker_reader_started", metrics={"sr": sr, "ch": ch, "frames_per_read": num_frames})
                 while True:
                     try:
-                        data = self.speaker.read_frames(num_frames)
-                        # Skip speaker audio if using per-participant audio (to avoid duplicate/loopback audio)
+                        # Skip speaker audio if using per-participant audio (to avoid duplicate/loopback audio).
+                        # The device still has to be drained; the blocking read paces the loop, and
+                        # 100ms reads cut wakeups 5x versus 20ms reads plus a sleep.
                         if self._use_participant_audio:
-                            time.sleep(0.02)  # Still need to drain the buffer at ~20ms intervals
+                            read_frames(drain_frames)
                             continue
-                        if data and self._remote_audio_callback:
-                            self._speaker_frame_count += 1
-                            # Check if data has any non-zero content
-                            if isinstance(data, bytes) and any(b != 0 for b in data[:100]):
-                                self._speaker_nonzero_count += 1
-
-                            # Calculate RMS at speaker reader level (before any processing)
-                            rms_raw = 0
+                        data = read_frames(num_frames)
+                        cb = self._remote_audio_callback
+                        if data and cb:
+                            frame_count += 1
+                            # Bridge into existing callback path
+                            cb(data, sample_rate=sr, channels=ch)
+                            # Diagnostics are best-effort: drop the frame if the stats thread lags
                             try:
-                                if isinstance(data, bytes):
-                                    # Try int16 interpretation
-                                    arr = np.frombuffer(data, dtype=np.int16)
-                                    if arr.size > 0:
-                                        rms_raw = float(np.sqrt(np.mean(arr.astype(np.float64)**2)))
-                                        self._rms_samples.append(rms_raw)
-                                        if len(self._rms_samples) > 100:
-                                            self._rms_samples.pop(0)
-                                        if rms_raw > self._rms_max:
-                                            self._rms_max = rms_raw
-                            except Exception:
+                                stats_q.put_nowait((data, frame_count))
+                            except queue.Full:
                                 pass
-
-                            # Log every 500 frames (~10s) with RMS stats
-                            if self._speaker_frame_count == 1 or self._speaker_frame_count % 500 == 0:
-                                rms_avg = sum(self._rms_samples) / len(self._rms_samples) if self._rms_samples else 0
-                                rms_recent_max = max(self._rms_samples) if self._rms_samples else 0
-                                log_event("speaker_reader_stats", metrics={
-                                    "frames": self._speaker_frame_count,
-                                    "nonzero_frames": self._speaker_nonzero_count,
-                                    "data_len": len(data) if data else 0,
-                                    "rms_current": int(rms_raw),
-                                    "rms_avg_100": int(rms_avg),
-                                    "rms_max_100": int(rms_recent_max),
-                                    "rms_max_total": int(self._rms_max)
-                                })
-                            # Log high RMS events (potential speech)
-                            elif rms_raw > 50:
-                                log_event("speaker_high_rms", metrics={
-                                    "frame": self._speaker_frame_count,
-                                    "rms": int(rms_raw)
-                                })
-
-                            # Bridge into existing callback path
-                            self._remote_audio_callback(data, sample_rate=sr, channels=ch)
                         else:
                             # Back off slightly if no data
                             time.sleep(0.005)
                     except Exception as e:
-                        self._speaker_read_errors += 1
-                        log_event("speaker_read_error", reason="read_frames", metrics={"error": str(e), "errors_total": self._speaker_read_errors})
+                        read_errors += 1
+                        log_event("speaker_read_error", reason="read_frames", metrics={"error": str(e), "errors_total": read_errors})
                         time.sleep(0.05)
             except Exception as e:
                 log_event("speaker_reader_init_error", metrics={"error": str(e)})
 
+        threading.Thread(target=_speaker_stats, daemon=True).start()
         t = threading.Thread(target=_speaker_reader, daemon=True)
         t.start()
 
@@ -1452,6 +1823,7 @@ class DailyTransportWrapper(daily.EventHandler):
             log_event("daily_join_error", metrics={"error": str(error)})
             return
         self._joined = True
+        self._joined_event.set()
         log_event("daily_joined")
 
     def on_participant_joined(self, participant):
@@ -1497,9 +1869,13 @@ class DailyTransportWrapper(daily.EventHandler):
         # Set up per-participant audio renderer to receive ONLY this participant's audio
         # (not the bot's own audio loopback from the speaker)
         try:
-            import numpy as np
             self._participant_audio_frames = 0
-            self._participant_audio_rms_max = 0
+            stats_q = self._participant_stats_q
+            if stats_q is None:
+                # NumPy RMS and logs run on their own thread so the SDK audio thread only
+                # counts the frame, enqueues it and forwards it
+                stats_q = self._participant_stats_q = queue.Queue(maxsize=8)
+                threading.Thread(target=self._participant_stats, args=(stats_q,), daemon=True).start()
 
             def on_participant_audio(participant_id, audio_data, client):
                 """Called when audio is received from the remote participant.
@@ -1509,50 +1885,21 @@ class DailyTransportWrapper(daily.EventHandler):
                     audio_data: AudioData with audio_frames, sample_rate, num_channels
                     client: The Daily client object
                 """
-                if self._remote_audio_callback and audio_data:
+                cb = self._remote_audio_callback
+                if cb and audio_data:
                     try:
                         self._participant_audio_frames += 1
                         frames = audio_data.audio_frames
-
-                        # Calculate RMS for logging
-                        rms = 0
-                        if frames and isinstance(frames, bytes):
-                            try:
-                                arr = np.frombuffer(frames, dtype=np.int16)
-                                if arr.size > 0:
-                                    rms = int(np.sqrt(np.mean(arr.astype(np.float64)**2)))
-                                    if rms > self._participant_audio_rms_max:
-                                        self._participant_audio_rms_max = rms
-                            except Exception:
-                                pass
-
-                        # Log first frame and periodically
-                        if self._participant_audio_frames == 1:
-                            log_event("participant_audio_first_frame", metrics={
-                                "participant_id": participant_id,
-                                "sample_rate": audio_data.sample_rate,
-                                "channels": audio_data.num_channels,
-                                "frame_len": len(frames) if frames else 0,
-                                "rms": rms
-                            })
-                        elif self._participant_audio_frames % 500 == 0:
-                            log_event("participant_audio_stats", metrics={
-                                "frames": self._participant_audio_frames,
-                                "rms": rms,
-                                "rms_max": self._participant_audio_rms_max
-                            })
-                        elif rms > 500:  # Log high RMS events (potential speech)
-                            log_event("participant_audio_speech", metrics={
-                                "frame": self._participant_audio_frames,
-                                "rms": rms
-                            })
+                        sample_rate = audio_data.sample_rate
+                        channels = audio_data.num_channels
+                        # Diagnostics are best-effort: drop the frame if the stats thread lags
+                        try:
+                            stats_q.put_nowait((participant_id, frames, sample_rate, channels, self._participant_audio_frames))
+                        except queue.Full:
+                            pass
 
                         # audio_data is daily.AudioData with audio_frames, sample_rate, num_channels
-                        self._remote_audio_callback(
-                            frames,
-                            sample_rate=audio_data.sample_rate,
-                            channels=audio_data.num_channels
-                        )
+                        cb(frames, sample_rate=sample_rate, channels=channels)
                     except Exception as e:
                         eprint(f"participant audio callback error: {e}")
 
@@ -1565,6 +1912,47 @@ class DailyTransportWrapper(daily.EventHandler):
 
         self._participant_joined_flag.set()
 
+    @staticmethod
+    def _participant_stats(stats_q):
+        """Participant-audio RMS and logging, consumed off the SDK audio thread."""
+        rms_max = 0
+        while True:
+            participant_id, frames, sample_rate, channels, frame_no = stats_q.get()
+            try:
+                if frame_no == 1:
+                    rms_max = 0  # new renderer (participant joined)
+                # Calculate RMS for logging
+                rms = 0
+                if frames and isinstance(frames, bytes):
+                    arr = np.frombuffer(frames, dtype=np.int16)
+                    if arr.size > 0:
+                        rms = int(rms_int16(arr))
+                        if rms > rms_max:
+                            rms_max = rms
+
+                # Log first frame and periodically
+                if frame_no == 1:
+                    log_event("participant_audio_first_frame", metrics={
+                        "participant_id": participant_id,
+                        "sample_rate": sample_rate,
+                        "channels": channels,
+                        "frame_len": len(frames) if frames else 0,
+                        "rms": rms
+                    })
+                elif frame_no % 500 == 0:
+                    log_event("participant_audio_stats", metrics={
+                        "frames": frame_no,
+                        "rms": rms,
+                        "rms_max": rms_max
+                    })
+                elif rms > 500:  # Log high RMS events (potential speech)
+                    log_event("participant_audio_speech", metrics={
+                        "frame": frame_no,
+                        "rms": rms
+                    })
+            except Exception:
+                pass
+
     def _check_existing_participants(self):
         """Check if non-local participants already exist (user joined before bot)."""
         try:
@@ -1645,6 +2033,36 @@ def try_join_daily(room_url, token):
         raise
 
 
+# Events per "batch" frame; 1 (default) sends each event as its own frame. Raise it only against
+# an orchestrator whose worker WS handler unwraps batch items (internal/workerws)
+try:
+    _WS_BATCH_MAX = max(1, int(os.environ.get('WS_BATCH_MAX', '1')))
+except Exception:
+    _WS_BATCH_MAX = 1
+# Constant WS payloads, built once and shared by every hello/ack (serialized, never mutated)
+_WORKER_HELLO_PAYLOAD = {"version": "p1", "transport": "pipecat", "audio_format": "pcm16_48k_mono", "local_stop_capable": True}
+_CMD_ACK_OK_PAYLOAD = {"ack": True, "error": ""}
+
+
+def mark_activity(state: dict):
+    """Record activity now and wake the idle-exit wait (loop thread only)."""
+    state['last_activity_ms'] = _now_ts_ms()
+    state['activity_event'].set()
+
+
+def enqueue_ws(ws_queue: asyncio.Queue, evt: dict):
+    """Non-blocking put on the bounded WS queue (loop thread only); drops the oldest event when full."""
+    try:
+        ws_queue.put_nowait(evt)
+    except asyncio.QueueFull:
+        try:
+            dropped = ws_queue.get_nowait()
+        except asyncio.QueueEmpty:
+            dropped = None
+        ws_queue.put_nowait(evt)
+        log_event("ws_queue_drop", metrics={"dropped_type": (dropped or {}).get("type", ""), "maxsize": ws_queue.maxsize})
+
+
 async def run_ws(ws_url, worker_token, session_id, ws_queue, stop_event, state):
     if not ws_url:
         return
@@ -1656,28 +2074,28 @@ async def run_ws(ws_url, worker_token, session_id, ws_queue, stop_event, state):
         seq = 1
         hello = {
             "type": "worker_hello",
-            "ts_ms": int(time.time() * 1000),
+            "ts_ms": _now_ts_ms(),
             "session_id": session_id or "",
             "seq": seq,
-            "payload": {"version": "p1", "transport": "pipecat", "audio_format": "pcm16_48k_mono", "local_stop_capable": True}
+            "payload": _WORKER_HELLO_PAYLOAD
         }
         seq += 1
-        await ws.send(json.dumps(hello))
+        await ws.send(_json_dumps(hello))
 
         async def reader():
             nonlocal seq
             async for raw in ws:
                 try:
-                    msg = json.loads(raw)
+                    msg = _json_loads(raw)
                 except Exception:
                     continue
                 t = msg.get("type")
                 if t == "stop_tts":
                     stop_event.set()
                     cmd_id = msg.get("command_id")
-                    ack = {"type": "cmd_ack", "ts_ms": int(time.time() * 1000), "session_id": session_id or "", "seq": seq, "command_id": cmd_id, "payload": {"ack": True, "error": ""}}
+                    ack = {"type": "cmd_ack", "ts_ms": _now_ts_ms(), "session_id": session_id or "", "seq": seq, "command_id": cmd_id, "payload": _CMD_ACK_OK_PAYLOAD}
                     seq += 1
-                    await ws.send(json.dumps(ack))
+                    await ws.send(_json_dumps(ack))
                 elif t == "policy":
                     try:
                         p = msg.get("payload") or {}
@@ -1692,7 +2110,18 @@ async def run_ws(ws_url, worker_token, session_id, ws_queue, stop_event, state):
                 e = await ws_queue.get()
                 e["seq"] = seq
                 seq += 1
-                await ws.send(json.dumps(e))
+                if _WS_BATCH_MAX == 1 or ws_queue.empty():
+                    await ws.send(_json_dumps(e))
+                    continue
+                # Coalesce events that are already waiting into one "batch" frame; the
+                # server unwraps items and handles each (seq included) as its own message
+                batch = [e]
+                while len(batch) < _WS_BATCH_MAX and not ws_queue.empty():
+                    e = ws_queue.get_nowait()
+                    e["seq"] = seq
+                    seq += 1
+                    batch.append(e)
+                await ws.send(_json_dumps({"type": "batch", "ts_ms": _now_ts_ms(), "session_id": session_id or "", "items": batch}))
 
         await asyncio.gather(reader(), writer())
 
@@ -1718,11 +2147,17 @@ async def main():
         except Exception:
             session_id = None
 
-    ws_queue = asyncio.Queue()
+    # Bounded so a stalled (or absent) WS writer cannot grow it without limit; enqueue_ws drops oldest
+    ws_queue = asyncio.Queue(maxsize=int(os.environ.get('WS_QUEUE_MAX', '1024')))
     stop_event = asyncio.Event()
     # Shared worker state for local-stop logic (init early so WS policy can update it)
     state = {'speaking': False, 'active_utterance_id': '', 'last_vad_ts_ms': 0, 'tts_stop_emitted': False}
-    state['last_activity_ms'] = int(time.time() * 1000)
+    state['last_activity_ms'] = _now_ts_ms()
+    # Wakes the idle-exit wait in main() whenever last_activity_ms moves (see mark_activity)
+    state['activity_event'] = asyncio.Event()
+    # Per-utterance VAD counters and RMS profiling window; reset in place at utterance start
+    state['vad_counters'] = {'vad_starts_total': 0, 'vad_stops_allowed': 0, 'vad_suppressed_guard': 0, 'vad_suppressed_energy': 0, 'vad_suppressed_minframes': 0}
+    state['rms_samples'] = SampleWindow(RMS_SAMPLES_MAX)
     state['local_stop_enabled'] = os.environ.get('LOCAL_STOP_ENABLED', 'true').lower() not in ('0', 'false', 'no')
     # Guard to avoid barge-in before users hear anything; default 500ms (tunable)
     try:
@@ -1782,7 +2217,7 @@ async def main():
         orch_addr = os.environ.get('ORCH_ADDR') or 'localhost:9090'
         log_event("debug_orch_connecting", session_id=session_id or "", metrics={"addr": orch_addr})
         if not session_id:
-            session_id = f"sess-{int(time.time()*1000)}"
+            session_id = f"sess-{_now_ts_ms()}"
         orch = GatewayControlClient(session_id, loop, log_event, stop_event, state)
         await orch.connect()
         await orch.send_session_open(room_url)
@@ -1793,7 +2228,8 @@ async def main():
         voice_id_env = os.environ.get('ELEVENLABS_VOICE_ID', '')
 
         # Debounced, streaming TTS for LLM sentences: accumulate then stream for smoother replies
-        state['tts_accum_buf'] = []
+        # One list for the session; flushes join and clear it in place
+        tts_accum_buf = state['tts_accum_buf'] = []
         state['tts_accum_task'] = None
         try:
             debounce_ms = int(os.environ.get('TTS_LLM_ACCUM_DEBOUNCE_MS', '200'))
@@ -1801,17 +2237,17 @@ async def main():
             debounce_ms = 200
 
         async def _flush_tts_accum():
-            buf = state.get('tts_accum_buf') or []
-            state['tts_accum_buf'] = []
-            if not buf:
+            if not tts_accum_buf:
                 return
-            phrase_text = " ".join(buf).strip()
+            phrase_text = " ".join(tts_accum_buf).strip()
+            tts_accum_buf.clear()
             if not phrase_text:
                 return
             # New utterance id per flush
-            utterance_id2 = f"u-{int(time.time()*1000)}"
+            started_ms = _now_ts_ms()
+            utterance_id2 = f"u-{started_ms}"
             state['active_utterance_id'] = utterance_id2
-            state['tts_started_ts_ms'] = int(time.time() * 1000)
+            state['tts_started_ts_ms'] = started_ms
             state['tts_stop_emitted'] = False
             state['speaking'] = True
             log_event("orchestrator_start_tts_received", session_id=session_id or "", metrics={"text_len": len(phrase_text)})
@@ -1831,12 +2267,14 @@ async def main():
             finally:
                 state['speaking'] = False
                 state['active_utterance_id'] = ''
+                # Idle time counts from the end of playback
+                mark_activity(state)
 
         async def _on_start_tts(text: str):
             # Accumulate short sentences briefly to avoid staccato speech
-            state.setdefault('tts_accum_buf', []).append(text)
+            tts_accum_buf.append(text)
             # Mark activity on LLM sentence
-            state['last_activity_ms'] = int(time.time() * 1000)
+            mark_activity(state)
             t = state.get('tts_accum_task')
             if t and not t.done():
                 try:
@@ -1891,6 +2329,19 @@ async def main():
     except Exception as e:
         eprint("candidate audio hook unavailable:", e)
 
+    async def _shutdown():
+        """Release session-scoped clients; runs on every exit after the STT wiring."""
+        # Stop the audio-thread hand-off first so no STT call lands on a closing stream
+        stt_calls = state.get('stt_calls')
+        if stt_calls is not None:
+            await stt_calls.close()
+        if stt_client is not None:
+            await stt_client.close()
+        try:
+            await _close_tts_http_client()
+        except Exception:
+            pass
+
     # Decide streaming vs non-streaming
     use_streaming = os.environ.get('ELEVENLABS_STREAMING', 'true').lower() not in ('0', 'false', 'no')
     log_event("tts_mode", session_id=session_id or "", metrics={"streaming": use_streaming})
@@ -1906,16 +2357,19 @@ async def main():
     except Exception:
         vad_start_frames_during_tts = 10
     vad.min_start_frames = max(1, vad_start_frames_during_tts)
-    # Reset per-utterance counters and RMS profiling
-    state['vad_counters'] = {'vad_starts_total': 0, 'vad_stops_allowed': 0, 'vad_suppressed_guard': 0, 'vad_suppressed_energy': 0, 'vad_suppressed_minframes': 0}
-    state['rms_samples'] = []
+    # Reset per-utterance counters and RMS profiling in place (VADManager holds references)
+    vad_counters = state['vad_counters']
+    for k in vad_counters:
+        vad_counters[k] = 0
+    state['rms_samples'].clear()
     state['rms_last_sample_ts'] = 0
     state['guard_elapsed_logged'] = False
-    utterance_id = f"u-{int(time.time()*1000)}"
+    started_ms = _now_ts_ms()
+    utterance_id = f"u-{started_ms}"
     state['active_utterance_id'] = utterance_id
-    state['tts_started_ts_ms'] = int(time.time() * 1000)
+    state['tts_started_ts_ms'] = started_ms
     if session_id:
-        await ws_queue.put({
+        enqueue_ws(ws_queue, {
             "type": "tts_started",
             "ts_ms": state['tts_started_ts_ms'],
             "session_id": session_id,
@@ -1940,15 +2394,15 @@ async def main():
         else:
             # Fallback: fetch-then-play
             log_event("tts_fetch_start", session_id=session_id or "", utterance_id=utterance_id)
-            wav_bytes = await loop.run_in_executor(None, fetch_tts_wav, eleven_api_key, voice_id, phrase)
-            pcm_arr, sr_in, _ = decode_wav_pcm16(wav_bytes)
-            pcm_arr_48k = resample_to_48k(pcm_arr, sr_in)
-            pcm16_bytes = pcm_arr_48k.tobytes()
+            wav_bytes = await fetch_tts_wav_async(eleven_api_key, voice_id, phrase)
+            # Decode + resample are CPU-bound; keep them off the event loop thread
+            pcm16_bytes = await loop.run_in_executor(_tts_decode_pool(), decode_wav_to_pcm48k, wav_bytes)
             log_event("tts_fetch_done", session_id=session_id or "", utterance_id=utterance_id, metrics={"bytes": len(pcm16_bytes)})
             await playback_task(transport, pcm16_bytes, 48000, stop_event, loop, ws_queue, session_id, utterance_id, state)
     except Exception:
         log_event("bot_error", session_id=session_id or "", reason="publish_send_failed")
         log_event("bot_exit", session_id=session_id or "")
+        await _shutdown()
         return
     finally:
         speaking = False
@@ -1956,6 +2410,7 @@ async def main():
         state['active_utterance_id'] = ''
         vad.min_start_frames = 2  # restore default when not speaking
         state['tts_stop_emitted'] = False
+        mark_activity(state)
 
     # Stay alive while conversation is active or until idle timeout expires
     # BOT_STAY_CONNECTED_SECONDS remains a hard cap if set high; BOT_IDLE_EXIT_SECONDS controls idle-based exit
@@ -1963,6 +2418,11 @@ async def main():
     idle_log_next = 0
     log_event("bot_sleep_start", session_id=session_id, metrics={"idle_exit_s": idle_exit_s})
     start_ts = time.time()
+    # Event-driven: sleep until the idle deadline or the next status line; activity and
+    # barge-in wake the wait early so the deadline is recomputed
+    activity_event = state['activity_event']
+    stop_wait = asyncio.ensure_future(stop_event.wait())
+    activity_wait = asyncio.ensure_future(activity_event.wait())
     while True:
         now = time.time()
         # Never exit while actively speaking or with an active utterance
@@ -1981,17 +2441,24 @@ async def main():
         if int(now) >= idle_log_next:
             log_event("bot_idle_status", session_id=session_id, metrics={"idle_for_s": idle_for, "idle_exit_s": idle_exit_s, "speaking": state.get('speaking', False)})
             idle_log_next = int(now) + 10
-        # Wait 1s or until barge-in
-        try:
-            await asyncio.wait_for(stop_event.wait(), timeout=1.0)
+        # Wait until the earlier of the idle deadline and the next status line (small slack so
+        # the integer idle_for has crossed the threshold on wake-up), or until activity/barge-in
+        wake_at = min(last_ms / 1000 + idle_exit_s, idle_log_next)
+        await asyncio.wait((stop_wait, activity_wait), timeout=max(0.0, wake_at - now) + 0.01, return_when=asyncio.FIRST_COMPLETED)
+        if activity_wait.done():
+            activity_event.clear()
+            activity_wait = asyncio.ensure_future(activity_event.wait())
+        if stop_wait.done():
             # Barge-in triggered: mark activity and clear to allow next loop
-            state['last_activity_ms'] = int(time.time() * 1000)
+            state['last_activity_ms'] = _now_ts_ms()
             log_event("bot_barge_in_handled", session_id=session_id)
             stop_event.clear()
-        except asyncio.TimeoutError:
-            pass
+            stop_wait = asyncio.ensure_future(stop_event.wait())
+    stop_wait.cancel()
+    activity_wait.cancel()
 
     log_event("bot_exit", session_id=session_id or "")
+    await _shutdown()
 
     # Cleanup WS task if running
     if ws_task:
@@ -2004,7 +2471,11 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        # libuv-backed loop when available (set USE_UVLOOP=false to opt out)
+        if uvloop is not None and os.environ.get('USE_UVLOOP', 'true').lower() not in ('0', 'false', 'no'):
+            uvloop.run(main())
+        else:
+            asyncio.run(main())
     except Exception as e:
         eprint("fatal:", e)
         log_event("bot_exit")
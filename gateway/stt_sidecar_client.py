@@ -1,5 +1,7 @@
 import asyncio
 import os
+import time
+from collections import deque
 from typing import Optional, Callable
 
 try:
@@ -23,11 +25,23 @@ class STTSidecarClient:
         self._recv_task = None
         self.enabled = True
         self._orch = None
-        # Write lock to serialize gRPC stream writes (only one write allowed at a time)
-        self._write_lock = asyncio.Lock()
+        # Single writer task owns self._call.write (gRPC allows one write at a time);
+        # callers enqueue (is_audio, ClientMessage) in order. Audio is capped with drop-oldest
+        # so a stalled sidecar cannot back up the realtime path; control messages are never dropped.
+        self._out_q = deque()
+        self._out_wake = asyncio.Event()
+        self._send_task = None
+        self._audio_queued = 0
+        self._audio_queue_max = max(1, int(os.environ.get('STT_SEND_QUEUE_MAX', '10')))  # ~1s of 100ms batches
+        self.dropped_chunks = 0
+        # Bound on how long close() waits for the writer to flush (a wedged sidecar can stall write)
+        self._close_timeout = float(os.environ.get('STT_CLOSE_TIMEOUT_SEC', '2.0'))
         # metrics
         self.bytes_sent = 0
         self.frames_sent = 0
+        self._last_audio_log = 0.0  # loop time of the last stt_audio_sent (at most one per second)
+        self.write_errors = 0
+        self._last_write_error_log = 0.0  # loop time of the last stt_write_error (at most one per second)
 
     async def preconnect(self):
         from grpc import aio
@@ -36,6 +50,7 @@ class STTSidecarClient:
         self._channel = aio.insecure_channel(target)
         self._stub = stt_grpc.STTStub(self._channel)
         self._call = self._stub.Session()
+        self._send_task = self._loop.create_task(self._send_loop())
         self._recv_task = self._loop.create_task(self._recv_loop())
         self._log("stt_connected", session_id=self.session_id)
 
@@ -46,79 +61,143 @@ class STTSidecarClient:
         if not self._call:
             return
         msg = stt.ClientMessage(start=stt.ControlStart(session_id=self.session_id, worker_id="", utterance_id=utterance_id, language="en-US", sample_rate=16000, protocol_version="1"))
-        async with self._write_lock:
-            await self._call.write(msg)
+        self._enqueue(False, msg)
         self._log("stt_utterance_start", session_id=self.session_id, utterance_id=utterance_id)
 
     async def send_audio(self, pcm16k_bytes: bytes):
-        if not self._call or not pcm16k_bytes:
+        n = len(pcm16k_bytes)
+        if not n or self._call is None:
             return
-        dur_ms = int(len(pcm16k_bytes) / 32)
-        async with self._write_lock:
-            await self._call.write(stt.ClientMessage(audio=stt.AudioChunk(pcm16k=pcm16k_bytes, duration_ms=dur_ms)))
-        self.bytes_sent += len(pcm16k_bytes)
+        dur_ms = n // 32  # 16 kHz mono PCM16 = 32 bytes/ms
+        if self._audio_queued >= self._audio_queue_max:
+            self._drop_oldest_audio()
+        self._audio_queued += 1
+        self._enqueue(True, stt.ClientMessage(audio=stt.AudioChunk(pcm16k=pcm16k_bytes, duration_ms=dur_ms)))
+        self.bytes_sent += n
         self.frames_sent += 1
-        if self.frames_sent % 10 == 0:
+        now = self._loop.time()
+        if now - self._last_audio_log >= 1.0:
+            self._last_audio_log = now
             self._log("stt_audio_sent", session_id=self.session_id, metrics={"frames": self.frames_sent, "bytes": self.bytes_sent})
 
     async def end_utterance(self):
         if not self._call:
             return
-        async with self._write_lock:
-            await self._call.write(stt.ClientMessage(drain=stt.Drain()))
+        self._enqueue(False, stt.ClientMessage(drain=stt.Drain()))
         self._log("stt_utterance_end", session_id=self.session_id)
 
     async def close(self):
+        # Let the writer flush queued messages, then half-close the stream. wait_for cancels
+        # the writer if it is still blocked in write after the timeout.
+        if self._send_task is not None:
+            self._enqueue(False, None)
+            try:
+                await asyncio.wait_for(self._send_task, timeout=self._close_timeout)
+            except asyncio.TimeoutError:
+                self._log("stt_close_timeout", session_id=self.session_id, metrics={"timeout_s": self._close_timeout, "queued": len(self._out_q)})
+            except Exception:
+                pass
         try:
             if self._call:
-                await self._call.done_writing()
+                await asyncio.wait_for(self._call.done_writing(), timeout=self._close_timeout)
         except Exception:
             pass
+        if self._recv_task is not None:
+            self._recv_task.cancel()
+            try:
+                await self._recv_task
+            except asyncio.CancelledError:
+                pass
         try:
             if self._channel:
                 await self._channel.close()
         except Exception:
             pass
 
+    def _enqueue(self, is_audio: bool, msg):
+        self._out_q.append((is_audio, msg))
+        self._out_wake.set()
+
+    def _drop_oldest_audio(self):
+        q = self._out_q
+        for i, (is_audio, _) in enumerate(q):
+            if is_audio:
+                del q[i]
+                break
+        self._audio_queued -= 1
+        self.dropped_chunks += 1
+        if self.dropped_chunks % 50 == 1:
+            self._log("stt_backpressure_drop", session_id=self.session_id, metrics={"dropped_chunks": self.dropped_chunks, "queue_max": self._audio_queue_max})
+
+    async def _send_loop(self):
+        q = self._out_q
+        wake = self._out_wake
+        while True:
+            while not q:
+                wake.clear()
+                await wake.wait()
+            is_audio, msg = q.popleft()
+            if msg is None:
+                return
+            if is_audio:
+                self._audio_queued -= 1
+            try:
+                await self._call.write(msg)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # A dead stream fails every queued write; log the first and then a running count
+                self.write_errors += 1
+                now = self._loop.time()
+                if now - self._last_write_error_log >= 1.0:
+                    self._last_write_error_log = now
+                    self._log("stt_write_error", session_id=self.session_id, metrics={"which": msg.WhichOneof('msg'), "error": str(e), "errors_total": self.write_errors})
+
+    async def _on_interim(self, resp):
+        text = resp.interim.text
+        # Update recent interim state for local-stop dual-signal gating; wall-clock ms
+        # like the VAD's now_ms it is compared against
+        state = self._state
+        state['stt_last_interim_ts_ms'] = time.time_ns() // 1_000_000
+        state['stt_last_interim_len'] = len(text)
+        if self._orch is not None:
+            try:
+                await self._orch.send_transcript_interim(resp.interim.utterance_id, text)
+            except Exception:
+                pass
+        self._log("stt_transcript_interim", session_id=self.session_id, metrics={"chars": len(text)})
+
+    async def _on_final(self, resp):
+        text = resp.final.text
+        self._log("stt_transcript_final", session_id=self.session_id, metrics={"chars": len(text), "text": text[:100] if text else ""})
+        if self._orch is not None:
+            try:
+                self._log("stt_sending_to_orchestrator", session_id=self.session_id, metrics={"utterance_id": resp.final.utterance_id, "text_len": len(text)})
+                await self._orch.send_transcript_final(resp.final.utterance_id, text)
+                self._log("stt_sent_to_orchestrator", session_id=self.session_id)
+            except Exception as e:
+                self._log("stt_orchestrator_send_error", session_id=self.session_id, metrics={"error": str(e)})
+        else:
+            self._log("stt_no_orchestrator_attached", session_id=self.session_id)
+
+    async def _on_error(self, resp):
+        self._log("stt_error", session_id=self.session_id, metrics={"code": getattr(resp.error, 'enum_code', 0), "msg": resp.error.message})
+
     async def _recv_loop(self):
+        from grpc import aio
+        # One lookup per message; connected/metrics/pong have no handler and are ignored
+        handlers = {'interim': self._on_interim, 'final': self._on_final, 'error': self._on_error}
+        read = self._call.read
         try:
             while True:
-                resp = await self._call.read()
-                if resp is None:
-                    await asyncio.sleep(0.02)
-                    continue
-                which = resp.WhichOneof('msg')
-                if which == 'interim':
-                    text = resp.interim.text
-                    # Update recent interim state for local-stop dual-signal gating
-                    try:
-                        self._state['stt_last_interim_ts_ms'] = int(asyncio.get_running_loop().time() * 1000)
-                        self._state['stt_last_interim_len'] = len(text)
-                    except Exception:
-                        pass
-                    if self._orch is not None:
-                        try:
-                            await self._orch.send_transcript_interim(resp.interim.utterance_id, text)
-                        except Exception:
-                            pass
-                    self._log("stt_transcript_interim", session_id=self.session_id, metrics={"chars": len(text)})
-                elif which == 'final':
-                    text = resp.final.text
-                    self._log("stt_transcript_final", session_id=self.session_id, metrics={"chars": len(text), "text": text[:100] if text else ""})
-                    if self._orch is not None:
-                        try:
-                            self._log("stt_sending_to_orchestrator", session_id=self.session_id, metrics={"utterance_id": resp.final.utterance_id, "text_len": len(text)})
-                            await self._orch.send_transcript_final(resp.final.utterance_id, text)
-                            self._log("stt_sent_to_orchestrator", session_id=self.session_id)
-                        except Exception as e:
-                            self._log("stt_orchestrator_send_error", session_id=self.session_id, metrics={"error": str(e)})
-                    else:
-                        self._log("stt_no_orchestrator_attached", session_id=self.session_id)
-                elif which == 'error':
-                    self._log("stt_error", session_id=self.session_id, metrics={"code": getattr(resp.error, 'enum_code', 0), "msg": resp.error.message})
-                else:
-                    # connected/metrics/pong ignored here
-                    pass
+                resp = await read()
+                # grpc.aio signals end of stream with the EOF sentinel; there is nothing more to read
+                if resp is None or resp is aio.EOF:
+                    self._log("stt_stream_closed", session_id=self.session_id)
+                    return
+                handler = handlers.get(resp.WhichOneof('msg'))
+                if handler is not None:
+                    await handler(resp)
         except asyncio.CancelledError:
             return
         except Exception as e:
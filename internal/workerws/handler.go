@@ -22,6 +22,8 @@ type Message struct {
     CommandID   string         `json:"command_id,omitempty"`
     UtteranceID string         `json:"utterance_id,omitempty"`
     Payload     map[string]any `json:"payload,omitempty"`
+    // Items carries coalesced events when Type is "batch"; each item is handled as its own message.
+    Items       []Message      `json:"items,omitempty"`
 }
 
 type Server struct {
@@ -75,20 +77,7 @@ func (s *Server) HandleWorkerWS(w http.ResponseWriter, r *http.Request) {
     s.Store.AppendEvent(sessionID, "worker_connected", nil)
     s.lastSeq[sessionID] = 0
 
-    ctx := r.Context()
-    for {
-        typ, data, err := c.Read(ctx)
-        if err != nil {
-            break
-        }
-        if typ != ws.MessageText && typ != ws.MessageBinary {
-            continue
-        }
-        var msg Message
-        if err := json.Unmarshal(data, &msg); err != nil {
-            s.Store.AppendEvent(sessionID, "worker_msg_invalid", map[string]any{"error": err.Error()})
-            continue
-        }
+    handle := func(msg Message) {
         payload := msg.Payload
         if payload == nil { payload = map[string]any{} }
         payload["ts_ms"] = msg.TsMs
@@ -124,6 +113,29 @@ func (s *Server) HandleWorkerWS(w http.ResponseWriter, r *http.Request) {
             s.OnMessage(sessionID, msg)
         }
     }
+
+    ctx := r.Context()
+    for {
+        typ, data, err := c.Read(ctx)
+        if err != nil {
+            break
+        }
+        if typ != ws.MessageText && typ != ws.MessageBinary {
+            continue
+        }
+        var msg Message
+        if err := json.Unmarshal(data, &msg); err != nil {
+            s.Store.AppendEvent(sessionID, "worker_msg_invalid", map[string]any{"error": err.Error()})
+            continue
+        }
+        if msg.Type == "batch" {
+            for _, item := range msg.Items {
+                handle(item)
+            }
+            continue
+        }
+        handle(msg)
+    }
     _ = c.Close(ws.StatusNormalClosure, "done")
     s.Reg.Remove(sessionID)
     s.Store.AppendEvent(sessionID, "worker_disconnected", nil)
@@ -0,0 +1,84 @@
+package workerws
+
+import (
+    "context"
+    "net/http"
+    "net/http/httptest"
+    "strings"
+    "sync"
+    "testing"
+    "time"
+
+    "yuzu/agent/internal/auth"
+    "yuzu/agent/internal/config"
+    "yuzu/agent/internal/store"
+    "yuzu/agent/internal/types"
+
+    ws "nhooyr.io/websocket"
+)
+
+func TestBatchFrameDispatchesItemsInOrder(t *testing.T) {
+    var cfg config.Config
+    cfg.Worker.TokenSecret = "secret123"
+    cfg.Worker.TokenSkewSecs = 60
+    st := store.New()
+    sid := "abc"
+    if err := st.CreateSession(&types.Session{ID: sid, CreatedAt: time.Now()}); err != nil {
+        t.Fatalf("create session: %v", err)
+    }
+    srv := NewServer(cfg, st, NewRegistry())
+
+    want := []string{"vad_start", "tts_started", "vad_end"}
+    var mu sync.Mutex
+    var got []string
+    done := make(chan struct{})
+    srv.OnMessage = func(sessionID string, msg Message) {
+        mu.Lock()
+        defer mu.Unlock()
+        got = append(got, msg.Type)
+        if len(got) == len(want) {
+            close(done)
+        }
+    }
+    hs := httptest.NewServer(http.HandlerFunc(srv.HandleWorkerWS))
+    defer hs.Close()
+
+    tok, err := auth.GenerateWorkerToken(cfg.Worker.TokenSecret, sid, time.Now().Add(5*time.Minute).Unix())
+    if err != nil { t.Fatalf("gen: %v", err) }
+    ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+    defer cancel()
+    url := "ws" + strings.TrimPrefix(hs.URL, "http") + "/?session_id=" + sid
+    c, _, err := ws.Dial(ctx, url, &ws.DialOptions{HTTPHeader: http.Header{"Authorization": []string{"Bearer " + tok}}})
+    if err != nil { t.Fatalf("dial: %v", err) }
+    defer c.Close(ws.StatusNormalClosure, "done")
+
+    frame := `{"type":"batch","items":[` +
+        `{"type":"vad_start","ts_ms":1,"session_id":"abc","seq":1},` +
+        `{"type":"tts_started","ts_ms":2,"session_id":"abc","seq":2},` +
+        `{"type":"vad_end","ts_ms":3,"session_id":"abc","seq":3}]}`
+    if err := c.Write(ctx, ws.MessageText, []byte(frame)); err != nil {
+        t.Fatalf("write: %v", err)
+    }
+    select {
+    case <-done:
+    case <-ctx.Done():
+        t.Fatalf("timed out waiting for batch items")
+    }
+
+    mu.Lock()
+    defer mu.Unlock()
+    for i := range want {
+        if got[i] != want[i] {
+            t.Fatalf("dispatch order: got %v, want %v", got, want)
+        }
+    }
+    // The batch envelope itself is not an event; only its items reach the store
+    for _, ev := range st.ListEvents(sid) {
+        if ev.Type == "batch" {
+            t.Fatalf("batch envelope recorded as an event")
+        }
+        if ev.Type == "worker_seq_gap" {
+            t.Fatalf("unexpected seq gap: %v", ev.Payload)
+        }
+    }
+}